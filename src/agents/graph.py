@@ -1,6 +1,7 @@
 """LangGraph workflow for RFP processing."""
 
 import logging
+import threading
 from typing import Dict, Any, List
 
 from ..models.rfp_models import RFP
@@ -94,13 +95,16 @@ class RFPWorkflow:
 
 # Global workflow instance
 _workflow: RFPWorkflow | None = None
+_workflow_lock = threading.Lock()
 
 
 def get_workflow() -> RFPWorkflow:
-    """Get global workflow instance."""
+    """Get global workflow instance (created once per process)."""
     global _workflow
     if _workflow is None:
-        _workflow = RFPWorkflow()
+        with _workflow_lock:
+            if _workflow is None:
+                _workflow = RFPWorkflow()
     return _workflow
 
 
@@ -6,7 +6,7 @@ from typing import List, Dict, Any
 from .base_agent import BaseAgent
 from ..llm.client import LLMClient
 from ..llm.prompts import TECHNICAL_AGENT_SYSTEM_PROMPT
-from ..llm.retrieval import get_sku_candidates
+from ..llm.retrieval import get_sku_candidates_batch
 from ..services.spec_match_service import get_spec_match_service
 from ..models.rfp_models import RFP
 from ..models.sku_models import SKU, SKUFeature
@@ -47,10 +47,13 @@ class TechnicalAgent(BaseAgent):
             # Parse RFP from payload
             rfp = RFP(**payload['rfp'])
             
+            # Retrieve candidates for all items in one batched search
+            candidates_per_item = get_sku_candidates_batch(rfp.scope_of_supply, top_k=10)
+            
             # Process each RFP item
             recommendations = []
-            for item in rfp.scope_of_supply:
-                rec = self._process_rfp_item(item)
+            for item, candidates in zip(rfp.scope_of_supply, candidates_per_item):
+                rec = self._process_rfp_item(item, candidates)
                 recommendations.append(rec)
             
             output = TechnicalAgentOutput(
@@ -66,29 +69,24 @@ class TechnicalAgent(BaseAgent):
             self.log_error(e)
             raise
     
-    def _process_rfp_item(self, rfp_item) -> TechnicalRecommendation:
+    def _process_rfp_item(self, rfp_item, candidates: List[Dict[str, Any]]) -> TechnicalRecommendation:
         """Process single RFP item.
         
         Args:
             rfp_item: RFP item
+            candidates: Candidate SKUs from vector search
             
         Returns:
             Technical recommendation
         """
-        # Get candidate SKUs from vector search
-        candidates = get_sku_candidates(rfp_item, top_k=10)
+        # Convert candidate dicts to SKU objects
+        skus = [self._dict_to_sku(candidate) for candidate in candidates]
+        
+        # Compute spec match for all candidates at once
+        matches = self.spec_match_service.compute_spec_match_batch(rfp_item, skus)
         
-        # Compute spec match for each candidate
         scored_skus = []
-        for candidate in candidates:
-            # Convert candidate dict to SKU object
-            sku = self._dict_to_sku(candidate)
-            
-            # Compute match
-            match_percent, comparison = self.spec_match_service.compute_spec_match(
-                rfp_item, sku
-            )
-            
+        for sku, (match_percent, comparison) in zip(skus, matches):
             scored_skus.append({
                 "sku_id": sku.sku_id,
                 "product_name": sku.product_name,
@@ -26,6 +26,19 @@ async def create_pricing_breakdown(
         raise HTTPException(status_code=400, detail=str(e))
 
 
+@router.post("/breakdown/bulk", status_code=201)
+async def bulk_create_pricing_breakdowns(
+    pricing_data: List[PricingBreakdownCreate],
+    db: Session = Depends(get_db)
+):
+    """Create pricing breakdowns for many RFP items in one insert."""
+    try:
+        created = PricingService.bulk_create_breakdowns(db, pricing_data)
+        return {"created": created}
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
 @router.get("/breakdown/{breakdown_id}", response_model=PricingBreakdownResponse)
 async def get_pricing_breakdown(
     breakdown_id: int,
@@ -26,6 +26,19 @@ async def create_recommendation(
         raise HTTPException(status_code=400, detail=str(e))
 
 
+@router.post("/bulk", status_code=201)
+async def bulk_create_recommendations(
+    recs_data: List[TechnicalRecommendationCreate],
+    db: Session = Depends(get_db)
+):
+    """Create technical recommendations for many RFP items in one insert."""
+    try:
+        created = TechnicalRecommendationService.bulk_create_recommendations(db, recs_data)
+        return {"created": created}
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
 @router.get("/{recommendation_id}", response_model=TechnicalRecommendationResponse)
 async def get_recommendation(
     recommendation_id: int,
@@ -1,15 +1,15 @@
 """RFP upload and extraction API routes."""
 
+import asyncio
 import logging
 from fastapi import APIRouter, UploadFile, File, HTTPException, Depends, Query
 from sqlalchemy.orm import Session
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 from datetime import datetime, timedelta
 import uuid
 
 from ...db.database import get_db
 from ...services.rfp_extraction_service import RFPExtractionService
-from ...services.pdf_parser_service import PDFParserService
 from ...services.rfp_parser_service import RFPParserService
 from ...agents.graph import get_workflow
 from ...api.services.rfp_service import RFPService
@@ -60,23 +60,21 @@ async def extract_rfp_and_create_sku(
         
         logger.info(f"PDF size: {len(pdf_bytes)} bytes")
         
-        # Extract and convert RFP to SKU format
+        # Extract text once; it feeds both the SKU extraction and the full RFP parse
         extraction_service = RFPExtractionService()
-        sku_data_dict = extraction_service.process_rfp_pdf_complete(
-            pdf_bytes,
-            file.filename
-        )
-
-        # Parse full RFP for storage and workflow
-        pdf_parser = PDFParserService()
         rfp_parser = RFPParserService()
-        pdf_text = pdf_parser.extract_text_from_bytes(pdf_bytes)
+        pdf_text = await asyncio.to_thread(extraction_service.pdf_parser.extract_text_from_bytes, pdf_bytes)
 
         base_name = file.filename.rsplit('.', 1)[0].strip()
         rfp_id = f"RFP-UPLOAD-{base_name[:20].upper().replace(' ', '_')}-{uuid.uuid4().hex[:6].upper()}"
         source_url = f"upload://{file.filename}"
 
-        parsed_rfp = rfp_parser.parse_rfp_document(pdf_text, rfp_id=rfp_id, source_url=source_url)
+        # Both LLM parses run concurrently and off the event loop
+        rfp_data, parsed_rfp = await asyncio.gather(
+            extraction_service.extract_rfp_from_text_async(pdf_text, file.filename),
+            asyncio.to_thread(rfp_parser.parse_rfp_document, pdf_text, rfp_id=rfp_id, source_url=source_url)
+        )
+        sku_data_dict = extraction_service.convert_rfp_to_sku(rfp_data)
         if not parsed_rfp:
             # Fallback minimal RFP for storage and workflow
             parsed_rfp = RFP(
@@ -95,7 +93,7 @@ async def extract_rfp_and_create_sku(
             parsed_rfp.raw_text = pdf_text
 
         # Persist parsed RFP to disk for workflow use
-        rfp_parser.save_parsed_rfp(parsed_rfp)
+        await asyncio.to_thread(rfp_parser.save_parsed_rfp, parsed_rfp)
 
         # Build RFPCreate for database
         submission_deadline = parsed_rfp.submission_deadline or (datetime.utcnow() + timedelta(days=30))
@@ -181,7 +179,7 @@ async def extract_rfp_and_create_sku(
         if run_workflow:
             try:
                 workflow = get_workflow()
-                workflow_result = workflow.run_full_workflow_for_rfp(parsed_rfp.rfp_id)
+                workflow_result = await asyncio.to_thread(workflow.run_full_workflow_for_rfp, parsed_rfp.rfp_id)
                 response["workflow_result"] = workflow_result.model_dump()
             except Exception as workflow_error:
                 logger.error(f"Workflow error for RFP {parsed_rfp.rfp_id}: {workflow_error}")
@@ -199,6 +197,19 @@ async def extract_rfp_and_create_sku(
         )
 
 
+def _sku_preview(sku_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Summarize converted SKU data for the preview endpoints."""
+    return {
+        "sku_id": sku_data["sku_id"],
+        "product_name": sku_data["product_name"],
+        "category": sku_data["category"],
+        "description": sku_data["description"][:200] + "..." if len(sku_data["description"]) > 200 else sku_data["description"],
+        "features_count": len(sku_data.get("features", [])),
+        "features": sku_data.get("features", [])[:5],  # First 5 features
+        "raw_record": sku_data.get("raw_record", {})
+    }
+
+
 @router.post("/preview")
 async def preview_rfp_extraction(file: UploadFile = File(...)) -> Dict[str, Any]:
     """Preview RFP extraction without saving to database.
@@ -223,29 +234,70 @@ async def preview_rfp_extraction(file: UploadFile = File(...)) -> Dict[str, Any]
         
         # Extract RFP data
         extraction_service = RFPExtractionService()
-        sku_data = extraction_service.process_rfp_pdf_complete(
+        sku_data = await extraction_service.process_rfp_pdf_complete_async(
             pdf_bytes,
             file.filename
         )
         
         logger.info(f"Generated preview for SKU: {sku_data['sku_id']}")
         
+        return {"success": True, **_sku_preview(sku_data)}
+    
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error previewing RFP extraction: {str(e)}", exc_info=True)
+        raise HTTPException(
+            status_code=500,
+            detail=f"Error previewing RFP: {str(e)}"
+        )
+
+
+@router.post("/preview-batch")
+async def preview_rfp_extraction_batch(files: List[UploadFile] = File(...)) -> Dict[str, Any]:
+    """Preview RFP extraction for several PDFs without saving to database.
+    
+    Files are processed concurrently (bounded by PDF_PIPELINE_CONCURRENCY),
+    so PDF parsing for one file overlaps with LLM calls for others.
+    
+    Args:
+        files: PDF file uploads
+        
+    Returns:
+        Extracted SKU preview data per file, in upload order
+    """
+    logger.info(f"Received RFP batch preview request: {len(files)} files")
+    
+    try:
+        pdfs = []
+        for file in files:
+            # Validate file type
+            if not file.filename.lower().endswith('.pdf'):
+                raise HTTPException(status_code=400, detail=f"File must be a PDF: {file.filename}")
+            
+            pdf_bytes = await file.read()
+            if not pdf_bytes:
+                raise HTTPException(status_code=400, detail=f"PDF file is empty: {file.filename}")
+            pdfs.append((pdf_bytes, file.filename))
+        
+        extraction_service = RFPExtractionService()
+        sku_data_list = await extraction_service.process_rfp_pdfs_async(pdfs)
+        
+        logger.info(f"Generated previews for {len(sku_data_list)} SKUs")
+        
         return {
             "success": True,
-            "sku_id": sku_data["sku_id"],
-            "product_name": sku_data["product_name"],
-            "category": sku_data["category"],
-            "description": sku_data["description"][:200] + "..." if len(sku_data["description"]) > 200 else sku_data["description"],
-            "features_count": len(sku_data.get("features", [])),
-            "features": sku_data.get("features", [])[:5],  # First 5 features
-            "raw_record": sku_data.get("raw_record", {})
+            "previews": [
+                {"filename": filename, **_sku_preview(sku_data)}
+                for (_, filename), sku_data in zip(pdfs, sku_data_list)
+            ]
         }
     
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error previewing RFP extraction: {str(e)}", exc_info=True)
+        logger.error(f"Error previewing RFP batch extraction: {str(e)}", exc_info=True)
         raise HTTPException(
             status_code=500,
-            detail=f"Error previewing RFP: {str(e)}"
+            detail=f"Error previewing RFPs: {str(e)}"
         )
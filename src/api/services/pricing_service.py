@@ -1,5 +1,6 @@
 """Pricing service for database operations."""
 
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 from typing import List, Optional
 from datetime import datetime
@@ -26,6 +27,18 @@ class PricingService:
         db.refresh(breakdown)
         return breakdown
     
+    @staticmethod
+    def bulk_create_breakdowns(db: Session, pricing_data: List[PricingBreakdownCreate]) -> int:
+        """Create many pricing breakdowns with a single multi-row INSERT."""
+        if not pricing_data:
+            return 0
+        db.execute(
+            insert(PricingBreakdownModel),
+            [breakdown_data.model_dump() for breakdown_data in pricing_data]
+        )
+        db.commit()
+        return len(pricing_data)
+    
     @staticmethod
     def get_breakdown(db: Session, breakdown_id: int) -> Optional[PricingBreakdownModel]:
         """Get pricing breakdown by ID."""
@@ -1,5 +1,6 @@
 """Technical recommendation service for database operations."""
 
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 from typing import List, Optional
 from datetime import datetime
@@ -25,6 +26,18 @@ class TechnicalRecommendationService:
         db.refresh(recommendation)
         return recommendation
     
+    @staticmethod
+    def bulk_create_recommendations(db: Session, recs_data: List[TechnicalRecommendationCreate]) -> int:
+        """Create many technical recommendations with a single multi-row INSERT."""
+        if not recs_data:
+            return 0
+        db.execute(
+            insert(TechnicalRecommendationModel),
+            [rec_data.model_dump() for rec_data in recs_data]
+        )
+        db.commit()
+        return len(recs_data)
+    
     @staticmethod
     def get_recommendation(db: Session, recommendation_id: int) -> Optional[TechnicalRecommendationModel]:
         """Get recommendation by ID."""
@@ -40,11 +40,39 @@ class Settings(BaseSettings):
     vector_db_type: str = Field(default="qdrant", description="Vector database type")
     qdrant_url: str = Field(default="http://localhost:6333", description="Qdrant server URL")
     qdrant_api_key: Optional[str] = Field(default=None, description="Qdrant API key")
+    qdrant_prefer_grpc: bool = Field(default=True, description="Use gRPC transport for Qdrant queries")
+    qdrant_grpc_port: int = Field(default=6334, description="Qdrant gRPC port")
     vector_db_path: Path = Field(default=Path("./indexes"), description="Vector DB storage path")
+    qdrant_int8_quantization: bool = Field(
+        default=False,
+        description="Enable int8 scalar quantization on the Qdrant SKU collection"
+    )
+    qdrant_binary_quantization: bool = Field(
+        default=False,
+        description="Enable binary quantization on the Qdrant SKU collection (overrides int8)"
+    )
+    qdrant_rescore_oversampling: float = Field(
+        default=4.0,
+        description="Candidate oversampling factor for rescoring quantized Qdrant searches"
+    )
+    qdrant_hnsw_m: int = Field(default=32, description="HNSW graph degree for the Qdrant SKU collection")
+    qdrant_hnsw_ef_construct: int = Field(
+        default=200,
+        description="HNSW candidate list size while building the Qdrant SKU collection"
+    )
+    qdrant_hnsw_ef: int = Field(default=64, description="HNSW candidate list size per Qdrant search")
     
     # Embedding Model
     embedding_model: str = Field(default="cohere", description="Embedding model provider")
     cohere_api_key: str = Field(default="dummy_key", description="Cohere API key")
+    cohere_embedding_type: str = Field(
+        default="float",
+        description="Cohere embedding type: 'float' or 'int8' (int8 needs an index rebuilt with it)"
+    )
+    query_embedding_disk_cache: bool = Field(
+        default=True,
+        description="Persist query embeddings to a local SQLite cache"
+    )
     
     # Logging
     log_level: str = Field(default="INFO", description="Logging level")
@@ -52,6 +80,13 @@ class Settings(BaseSettings):
     # Optional Proxy
     proxy_url: Optional[str] = Field(default=None, description="HTTP proxy URL")
     
+    # Scraping
+    scrape_concurrency: int = Field(default=8, description="Maximum concurrent page fetches")
+    scrape_conditional_get: bool = Field(
+        default=True,
+        description="Cache fetched pages on disk and revalidate them with ETag/Last-Modified"
+    )
+    
     model_config = SettingsConfigDict(
         env_file=".env",
         env_file_encoding="utf-8",
@@ -97,6 +132,10 @@ class Settings(BaseSettings):
         """Get tests directory."""
         return self.data_dir / "tests"
     
+    def get_http_cache_dir(self) -> Path:
+        """Get scraped page cache directory."""
+        return self.data_dir / "http_cache"
+    
     def get_sku_index_dir(self) -> Path:
         """Get SKU vector index directory."""
         return self.indexes_dir / "sku_index"
@@ -104,6 +143,10 @@ class Settings(BaseSettings):
     def get_rfp_index_dir(self) -> Path:
         """Get RFP vector index directory."""
         return self.indexes_dir / "rfp_index"
+    
+    def get_query_embedding_cache_path(self) -> Path:
+        """Get query embedding cache database path."""
+        return self.indexes_dir / "query_embeddings.sqlite"
 
 
 # Global settings instance
@@ -1,13 +1,16 @@
 """Build vector indexes for SKUs using Cohere embeddings and Qdrant."""
 
+import argparse
+import asyncio
 import logging
+import math
+import multiprocessing
 from pathlib import Path
+from typing import Any, Dict, List, Tuple
 import json
 import uuid
 
-from qdrant_client import QdrantClient
-from qdrant_client.models import Distance, VectorParams, PointStruct
-import cohere
+import numpy as np
 
 from ..config import settings as app_settings
 from .sku_loader import load_skus
@@ -15,6 +18,14 @@ from ..models.sku_models import SKU
 
 logger = logging.getLogger(__name__)
 
+# Cohere's embed endpoint accepts at most 96 texts per request
+EMBED_BATCH_SIZE = 96
+EMBED_MODEL = "embed-v4.0"
+
+# Written next to the SKU index after a successful build; an unchanged
+# signature lets a non-forced build skip re-embedding the catalog
+BUILD_SIGNATURE_FILE = "build_signature.json"
+
 
 def _sku_to_text(sku: SKU) -> str:
     """Convert SKU to text representation for indexing.
@@ -39,30 +50,143 @@ def _sku_to_text(sku: SKU) -> str:
     return "\n".join(parts)
 
 
-def build_sku_index(force_rebuild: bool = False) -> bool:
-    """Build vector index for SKU product specifications using Cohere embeddings and Qdrant.
+def _sku_index_signature() -> Dict[str, Any]:
+    """Describe the catalog file and settings the SKU index is built from.
+    
+    Returns:
+        JSON-serializable signature
+    """
+    specs_file = app_settings.get_product_specs_dir() / "product_specs.csv"
+    try:
+        stat = specs_file.stat()
+        source = [stat.st_mtime_ns, stat.st_size]
+    except FileNotFoundError:
+        source = None
+    
+    return {
+        "product_specs": source,
+        "embed_model": EMBED_MODEL,
+        "embedding_type": app_settings.cohere_embedding_type,
+        "hnsw_m": app_settings.qdrant_hnsw_m,
+        "hnsw_ef_construct": app_settings.qdrant_hnsw_ef_construct,
+        "int8_quantization": app_settings.qdrant_int8_quantization,
+        "binary_quantization": app_settings.qdrant_binary_quantization,
+    }
+
+
+def _sku_index_is_current(signature: Dict[str, Any], collection_name: str) -> bool:
+    """Check whether the SKU index was built from the same catalog and settings.
     
     Args:
-        force_rebuild: Force rebuild even if index exists
+        signature: Signature from _sku_index_signature
+        collection_name: Qdrant collection holding the index
         
     Returns:
-        True if successful
+        True if the stored signature matches and the collection still exists
     """
-    logger.info("Building SKU vector index with Cohere embeddings and Qdrant...")
+    if signature["product_specs"] is None:
+        return False
+    
+    signature_file = app_settings.get_sku_index_dir() / BUILD_SIGNATURE_FILE
+    try:
+        if json.loads(signature_file.read_text(encoding="utf-8")) != signature:
+            return False
+    except (OSError, ValueError):
+        return False
     
+    # The signature alone is not enough if the Qdrant volume was reset
     try:
-        # Initialize Cohere client
-        cohere_client = cohere.ClientV2(api_key=app_settings.cohere_api_key)
-        logger.info("✓ Cohere client initialized")
+        from qdrant_client import QdrantClient
         
-        # Initialize Qdrant client
         qdrant_client = QdrantClient(
             url=app_settings.qdrant_url,
             api_key=app_settings.qdrant_api_key,
             prefer_grpc=False
         )
-        logger.info(f"✓ Qdrant client connected to {app_settings.qdrant_url}")
+        try:
+            return qdrant_client.collection_exists(collection_name)
+        finally:
+            qdrant_client.close()
+    except Exception as e:
+        logger.warning(f"Could not check Qdrant collection {collection_name}: {e}")
+        return False
+
+
+def _save_sku_index_signature(signature: Dict[str, Any]) -> None:
+    """Record the signature of a successful SKU index build.
+    
+    Args:
+        signature: Signature from _sku_index_signature
+    """
+    index_dir = app_settings.get_sku_index_dir()
+    try:
+        index_dir.mkdir(parents=True, exist_ok=True)
+        (index_dir / BUILD_SIGNATURE_FILE).write_text(json.dumps(signature, indent=2), encoding="utf-8")
+    except OSError as e:
+        logger.warning(f"Could not save SKU index build signature: {e}")
+
+
+def _typed_feature_value(value: str) -> Any:
+    """Parse a numeric feature value into int or float for the Qdrant payload.
+    
+    Only values that round-trip exactly (e.g. "240", "3.5") are converted,
+    so str() of the payload value gives back the original text; anything
+    else (e.g. "1.10", "240 sq.mm") stays a string.
+    
+    Args:
+        value: Feature value as loaded from the catalog
         
+    Returns:
+        int, float or the original string
+    """
+    for cast in (int, float):
+        try:
+            typed = cast(value)
+        except (TypeError, ValueError):
+            continue
+        if math.isfinite(typed) and str(typed) == value:
+            return typed
+    return value
+
+
+def _sku_payload_metadata(sku: SKU) -> Dict[str, Any]:
+    """Build the Qdrant payload metadata for a SKU, with typed numeric features.
+    
+    Args:
+        sku: SKU object
+        
+    Returns:
+        SKU dict (see SKU.to_dict) with numeric feature values as numbers
+    """
+    metadata = sku.to_dict()
+    metadata["features"] = {
+        name: _typed_feature_value(value) for name, value in metadata["features"].items()
+    }
+    return metadata
+
+
+def build_sku_index(force_rebuild: bool = False, workers: int = 1) -> bool:
+    """Build vector index for SKU product specifications using Cohere embeddings and Qdrant.
+    
+    Without force_rebuild, the build is skipped when product_specs.csv and
+    the index settings are unchanged since the last successful build.
+    
+    Args:
+        force_rebuild: Force rebuild even if index exists
+        workers: Number of ingest processes; only worth raising for very large catalogs
+        
+    Returns:
+        True if successful
+    """
+    collection_name = "sku_index"
+    signature = _sku_index_signature()
+    if not force_rebuild and _sku_index_is_current(signature, collection_name):
+        logger.info("✓ SKU index is up to date (catalog and settings unchanged); skipping rebuild")
+        return True
+    
+    logger.info("Building SKU vector index with Cohere embeddings and Qdrant...")
+    
+    try:
         # Load SKUs from CSV
         logger.info("Loading SKUs from product_specs.csv...")
         repository = load_skus()
@@ -74,91 +198,35 @@ def build_sku_index(force_rebuild: bool = False) -> bool:
         logger.info(f"✓ Loaded {len(repository.skus)} SKUs")
         
         # Convert SKUs to text documents
+        # Payload metadata is the SKU's dict form with typed numbers; raw_record stays out of Qdrant
         documents = []
         for sku in repository.skus:
             doc_text = _sku_to_text(sku)
-            doc_metadata = {
-                "sku_id": sku.sku_id,
-                "product_name": sku.product_name,
-                "category": sku.category,
-                "features": {f.name: str(f.value) for f in sku.features}
-            }
             documents.append({
                 "text": doc_text,
-                "metadata": doc_metadata,
+                "payload": {
+                    "text": doc_text,
+                    "metadata": _sku_payload_metadata(sku)
+                },
                 "id": str(uuid.uuid4())
             })
         
         logger.info(f"✓ Created {len(documents)} documents for indexing")
         
-        # Generate embeddings using Cohere
-        logger.info("Generating embeddings using Cohere (embed-v4.0)...")
-        
-        # Batch embeddings to avoid rate limits
-        batch_size = 100
-        all_texts = [doc["text"] for doc in documents]
-        all_embeddings = []
-        
-        for i in range(0, len(all_texts), batch_size):
-            batch_texts = all_texts[i:i + batch_size]
-            logger.info(f"  Embedding batch {i // batch_size + 1}/{(len(all_texts) + batch_size - 1) // batch_size}")
-            
-            response = cohere_client.embed(
-                model="embed-v4.0",
-                input_type="search_document",
-                texts=batch_texts
+        if workers > 1:
+            total_points, embedding_dim = _embed_and_upload_sharded(
+                documents, collection_name, workers
             )
-            all_embeddings.extend(response.embeddings)
-        
-        logger.info(f"✓ Generated {len(all_embeddings)} embeddings")
-        
-        # Create or recreate collection
-        collection_name = "sku_index"
-        
-        try:
-            qdrant_client.delete_collection(collection_name=collection_name)
-            logger.info(f"Deleted existing collection: {collection_name}")
-        except Exception:
-            pass  # Collection doesn't exist yet
-        
-        # Create collection with embedding dimension
-        embedding_dim = len(all_embeddings[0]) if all_embeddings else 1024
-        logger.info(f"Creating Qdrant collection: {collection_name} (dim={embedding_dim})")
-        
-        qdrant_client.create_collection(
-            collection_name=collection_name,
-            vectors_config=VectorParams(size=embedding_dim, distance=Distance.COSINE)
-        )
-        logger.info(f"✓ Collection created")
-        
-        # Create points from documents and embeddings
-        logger.info("Preparing points for upload to Qdrant...")
-        points = []
-        for idx, (doc, embedding) in enumerate(zip(documents, all_embeddings)):
-            point = PointStruct(
-                id=idx,
-                vector=embedding,
-                payload={
-                    "text": doc["text"],
-                    "metadata": doc["metadata"]
-                }
+        else:
+            total_points, embedding_dim = asyncio.run(
+                _embed_and_upload(documents, collection_name)
             )
-            points.append(point)
-        
-        # Upload in batches
-        batch_size = 100
-        for i in range(0, len(points), batch_size):
-            batch_points = points[i:i + batch_size]
-            qdrant_client.upsert(
-                collection_name=collection_name,
-                points=batch_points
-            )
-            logger.info(f"  Uploaded {min(i + batch_size, len(points))}/{len(points)} points")
         
         logger.info(f"✓ SKU index created in Qdrant (collection: {collection_name})")
-        logger.info(f"  Total points: {len(points)}")
+        logger.info(f"  Total points: {total_points}")
         logger.info(f"  Embedding dimension: {embedding_dim}")
         
+        _save_sku_index_signature(signature)
         return True
         
     except Exception as e:
@@ -168,11 +236,278 @@ def build_sku_index(force_rebuild: bool = False) -> bool:
         return False
 
 
-def build_all_indexes(force_rebuild: bool = False) -> bool:
+def _embed_and_upload_sharded(
+    documents: List[Dict[str, Any]],
+    collection_name: str,
+    workers: int
+) -> Tuple[int, int]:
+    """Split documents into contiguous shards and ingest each in its own process.
+    
+    The collection is created up front by this process; each worker then runs
+    the embed/upload pipeline with its own Cohere and Qdrant clients.
+    
+    Args:
+        documents: Documents with 'text' and 'payload'
+        collection_name: Qdrant collection to (re)create
+        workers: Number of worker processes
+        
+    Returns:
+        Tuple of (points uploaded, embedding dimension)
+    """
+    embedding_dim = asyncio.run(_prepare_collection(documents[0]["text"], collection_name))
+    
+    shard_size = (len(documents) + workers - 1) // workers
+    shards = [
+        (documents[start:start + shard_size], collection_name, start)
+        for start in range(0, len(documents), shard_size)
+    ]
+    logger.info(f"Ingesting {len(documents)} documents across {len(shards)} worker processes")
+    
+    with multiprocessing.Pool(processes=len(shards)) as pool:
+        uploaded = sum(pool.map(_ingest_shard, shards))
+    
+    return uploaded, embedding_dim
+
+
+def _ingest_shard(shard: Tuple[List[Dict[str, Any]], str, int]) -> int:
+    """Worker entry point: ingest one shard into an existing collection.
+    
+    Args:
+        shard: Tuple of (documents, collection name, id offset)
+        
+    Returns:
+        Number of points uploaded
+    """
+    documents, collection_name, id_offset = shard
+    uploaded, _ = asyncio.run(
+        _embed_and_upload(
+            documents,
+            collection_name,
+            id_offset=id_offset,
+            recreate_collection=False
+        )
+    )
+    return uploaded
+
+
+async def _prepare_collection(sample_text: str, collection_name: str) -> int:
+    """Probe the embedding dimension with one text and recreate the collection.
+    
+    Args:
+        sample_text: Text to embed for the dimension probe
+        collection_name: Qdrant collection to (re)create
+        
+    Returns:
+        Embedding dimension
+    """
+    from qdrant_client import AsyncQdrantClient
+    import cohere
+    
+    cohere_client = cohere.AsyncClientV2(api_key=app_settings.cohere_api_key)
+    sample = await _embed_texts(cohere_client, [sample_text])
+    embedding_dim = sample.shape[1]
+    
+    qdrant_client = AsyncQdrantClient(
+        url=app_settings.qdrant_url,
+        api_key=app_settings.qdrant_api_key,
+        prefer_grpc=False
+    )
+    try:
+        await _recreate_collection(qdrant_client, collection_name, embedding_dim)
+    finally:
+        await qdrant_client.close()
+    
+    return embedding_dim
+
+
+async def _embed_texts(cohere_client, texts: List[str]) -> np.ndarray:
+    """Embed document texts with Cohere into a float32 matrix.
+    
+    With COHERE_EMBEDDING_TYPE=int8 Cohere returns quantized vectors, a quarter
+    of the response size; their integer values are exact in the float16
+    collection.
+    
+    Args:
+        cohere_client: Async Cohere client
+        texts: Texts to embed
+        
+    Returns:
+        Array of shape (len(texts), dim)
+    """
+    response = await cohere_client.embed(
+        model=EMBED_MODEL,
+        input_type="search_document",
+        texts=texts,
+        embedding_types=[app_settings.cohere_embedding_type]
+    )
+    embedding_type = app_settings.cohere_embedding_type
+    embeddings = getattr(response.embeddings, "float_" if embedding_type == "float" else embedding_type)
+    return np.asarray(embeddings, dtype=np.float32)
+
+
+async def _embed_and_upload(
+    documents: List[Dict[str, Any]],
+    collection_name: str,
+    batch_size: int = EMBED_BATCH_SIZE,
+    id_offset: int = 0,
+    recreate_collection: bool = True
+) -> Tuple[int, int]:
+    """Embed documents with Cohere and upload them to Qdrant as a pipeline.
+    
+    An embedder coroutine pushes embedded batches into a bounded queue while
+    an uploader coroutine drains it, so batch N+1 is embedded while batch N
+    is uploaded. The queue size bounds how many batches are held in memory.
+    
+    Args:
+        documents: Documents with 'text' and 'payload'
+        collection_name: Qdrant collection to (re)create
+        batch_size: Documents per embedding/upload batch
+        id_offset: Offset added to point ids (for sharded ingest)
+        recreate_collection: Drop and recreate the collection on the first batch
+        
+    Returns:
+        Tuple of (points uploaded, embedding dimension)
+    """
+    # Heavy SDKs are imported lazily so importing this module stays cheap
+    from qdrant_client import AsyncQdrantClient
+    from qdrant_client.models import PointStruct
+    import cohere
+    
+    cohere_client = cohere.AsyncClientV2(api_key=app_settings.cohere_api_key)
+    logger.info("✓ Cohere client initialized")
+    
+    qdrant_client = AsyncQdrantClient(
+        url=app_settings.qdrant_url,
+        api_key=app_settings.qdrant_api_key,
+        prefer_grpc=False
+    )
+    logger.info(f"✓ Qdrant client connected to {app_settings.qdrant_url}")
+    
+    queue: asyncio.Queue = asyncio.Queue(maxsize=2)
+    num_batches = (len(documents) + batch_size - 1) // batch_size
+    
+    async def embedder() -> None:
+        logger.info("Generating embeddings using Cohere (embed-v4.0)...")
+        try:
+            for start in range(0, len(documents), batch_size):
+                batch_docs = documents[start:start + batch_size]
+                logger.info(f"  Embedding batch {start // batch_size + 1}/{num_batches}")
+                
+                batch_matrix = await _embed_texts(
+                    cohere_client, [doc["text"] for doc in batch_docs]
+                )
+                await queue.put((start, batch_docs, batch_matrix))
+        except Exception:
+            await queue.put(None)
+            raise
+        await queue.put(None)
+    
+    async def uploader() -> Tuple[int, int]:
+        uploaded = 0
+        embedding_dim = 0
+        while (item := await queue.get()) is not None:
+            start, batch_docs, batch_matrix = item
+            if not embedding_dim:
+                # Collection is created once the first batch reveals the dimension
+                embedding_dim = batch_matrix.shape[1]
+                if recreate_collection:
+                    await _recreate_collection(qdrant_client, collection_name, embedding_dim)
+            
+            # Points are generated lazily and consumed by upload_points, so no
+            # list of PointStruct is materialized alongside the batch matrix.
+            # upload_points is blocking even on the async client, hence the thread.
+            points_iter = (
+                PointStruct(
+                    id=id_offset + start + offset,
+                    vector=batch_matrix[offset].tolist(),
+                    payload=doc["payload"]
+                )
+                for offset, doc in enumerate(batch_docs)
+            )
+            await asyncio.to_thread(
+                qdrant_client.upload_points,
+                collection_name=collection_name,
+                points=points_iter,
+                batch_size=batch_size,
+                wait=True
+            )
+            uploaded += len(batch_docs)
+            logger.info(f"  Uploaded {uploaded}/{len(documents)} points")
+        return uploaded, embedding_dim
+    
+    try:
+        _, result = await asyncio.gather(embedder(), uploader())
+        return result
+    finally:
+        await qdrant_client.close()
+
+
+async def _recreate_collection(qdrant_client, collection_name: str, embedding_dim: int) -> None:
+    """Drop and recreate the Qdrant collection for the given dimension.
+    
+    Args:
+        qdrant_client: Async Qdrant client
+        collection_name: Collection name
+        embedding_dim: Vector dimension
+    """
+    from qdrant_client.models import (
+        BinaryQuantization,
+        BinaryQuantizationConfig,
+        Datatype,
+        Distance,
+        HnswConfigDiff,
+        ScalarQuantization,
+        ScalarQuantizationConfig,
+        ScalarType,
+        VectorParams,
+    )
+    
+    try:
+        await qdrant_client.delete_collection(collection_name=collection_name)
+        logger.info(f"Deleted existing collection: {collection_name}")
+    except Exception:
+        pass  # Collection doesn't exist yet
+    
+    logger.info(f"Creating Qdrant collection: {collection_name} (dim={embedding_dim})")
+    
+    # Store vectors as float16 to halve upload bytes and collection RAM
+    quantization_config = None
+    if app_settings.qdrant_binary_quantization:
+        # One bit per dimension; searches shortlist on bits and rescore on float16
+        quantization_config = BinaryQuantization(
+            binary=BinaryQuantizationConfig(always_ram=True)
+        )
+    elif app_settings.qdrant_int8_quantization:
+        quantization_config = ScalarQuantization(
+            scalar=ScalarQuantizationConfig(
+                type=ScalarType.INT8,
+                quantile=0.99,
+                always_ram=True
+            )
+        )
+    
+    await qdrant_client.create_collection(
+        collection_name=collection_name,
+        vectors_config=VectorParams(
+            size=embedding_dim,
+            distance=Distance.COSINE,
+            datatype=Datatype.FLOAT16
+        ),
+        hnsw_config=HnswConfigDiff(
+            m=app_settings.qdrant_hnsw_m,
+            ef_construct=app_settings.qdrant_hnsw_ef_construct
+        ),
+        quantization_config=quantization_config
+    )
+    logger.info(f"✓ Collection created")
+
+
+def build_all_indexes(force_rebuild: bool = False, workers: int = 1) -> bool:
     """Build all vector indexes.
     
     Args:
         force_rebuild: Force rebuild even if indexes exist
+        workers: Number of ingest processes for the SKU index
         
     Returns:
         True if all successful
@@ -184,7 +519,7 @@ def build_all_indexes(force_rebuild: bool = False) -> bool:
     success = True
     
     # Build SKU index
-    if not build_sku_index(force_rebuild=force_rebuild):
+    if not build_sku_index(force_rebuild=force_rebuild, workers=workers):
         logger.error("Failed to build SKU index")
         success = False
     
@@ -199,9 +534,23 @@ def build_all_indexes(force_rebuild: bool = False) -> bool:
 
 
 if __name__ == "__main__":
-    # For direct execution: python -m src.data_ingestion.build_indexes
+    # For direct execution: python -m src.data_ingestion.build_indexes [--workers N] [--force]
+    parser = argparse.ArgumentParser(description="Build vector indexes")
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Rebuild even if the catalog and index settings are unchanged"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of ingest processes (useful only for very large SKU catalogs)"
+    )
+    args = parser.parse_args()
+    
     logging.basicConfig(
         level=logging.INFO,
         format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
     )
-    build_all_indexes(force_rebuild=True)
\ No newline at end of file
+    build_all_indexes(force_rebuild=args.force, workers=args.workers)
\ No newline at end of file
@@ -1,8 +1,8 @@
 """Database configuration and session management."""
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker, declarative_base
-from sqlalchemy.pool import StaticPool
+from sqlalchemy.pool import NullPool, StaticPool
 from typing import Generator
 import os
 from pathlib import Path
@@ -16,11 +16,28 @@ DATABASE_URL = os.getenv(
 # Create engine with appropriate pool settings
 if DATABASE_URL.startswith("sqlite"):
     # SQLite specific settings
-    engine = create_engine(
-        DATABASE_URL,
-        connect_args={"check_same_thread": False},
-        poolclass=StaticPool,
-    )
+    if DATABASE_URL in ("sqlite://", "sqlite:///:memory:"):
+        # In-memory databases (tests) must share a single connection
+        engine = create_engine(
+            DATABASE_URL,
+            connect_args={"check_same_thread": False},
+            poolclass=StaticPool,
+        )
+    else:
+        # File databases: short-lived connections, WAL for concurrent readers
+        engine = create_engine(
+            DATABASE_URL,
+            connect_args={"check_same_thread": False, "timeout": 30},
+            poolclass=NullPool,
+        )
+
+        @event.listens_for(engine, "connect")
+        def _set_sqlite_pragmas(dbapi_connection, connection_record):
+            """Enable WAL journaling on every new SQLite connection."""
+            cursor = dbapi_connection.cursor()
+            cursor.execute("PRAGMA journal_mode=WAL")
+            cursor.execute("PRAGMA synchronous=NORMAL")
+            cursor.close()
 else:
     # For PostgreSQL or other databases
     engine = create_engine(
@@ -1,11 +1,56 @@
 """Database models for RFP Platform."""
 
-from sqlalchemy import Column, String, Float, DateTime, Text, Boolean, Integer, ForeignKey, JSON
+from sqlalchemy import Column, String, Float, DateTime, Text, Boolean, Integer, ForeignKey, Index, JSON
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.orm import relationship
-from datetime import datetime
+from sqlalchemy.sql.expression import FunctionElement
 from src.db.database import Base
 
 
+class utcnow(FunctionElement):
+    """Current UTC time as a naive timestamp, evaluated by the database.
+    
+    Timestamps are filled by the database rather than by a Python callback per
+    row, so bulk inserts stay a single executemany. Plain now() would store
+    session-local time in PostgreSQL's TIMESTAMP WITHOUT TIME ZONE, and
+    SQLite's CURRENT_TIMESTAMP only has one-second precision.
+    """
+    
+    type = DateTime()
+    inherit_cache = True
+
+
+@compiles(utcnow)
+def _utcnow_default(element, compiler, **kw):
+    return "CURRENT_TIMESTAMP"
+
+
+@compiles(utcnow, "postgresql")
+def _utcnow_postgresql(element, compiler, **kw):
+    return "TIMEZONE('utc', CURRENT_TIMESTAMP)"
+
+
+@compiles(utcnow, "sqlite")
+def _utcnow_sqlite(element, compiler, **kw):
+    # Millisecond precision, in the format SQLAlchemy's SQLite DateTime parses
+    return "STRFTIME('%Y-%m-%d %H:%M:%f', 'now')"
+
+# JSON documents are stored as binary JSONB on PostgreSQL (indexable with GIN)
+# and as plain JSON elsewhere.
+JSONDocument = JSON().with_variant(JSONB(), "postgresql")
+
+
+def _jsonb_gin_index(name: str, column: str) -> Index:
+    """Build a PostgreSQL-only GIN index for containment (@>) queries on a JSONB column."""
+    return Index(
+        name,
+        column,
+        postgresql_using="gin",
+        postgresql_ops={column: "jsonb_path_ops"}
+    ).ddl_if(dialect="postgresql")
+
+
 class RFPModel(Base):
     """RFP document database model."""
     
@@ -18,27 +63,28 @@ class RFPModel(Base):
     buyer = Column(String(255), nullable=True)
     summary = Column(Text, nullable=True)
     raw_text = Column(Text, nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, default=utcnow(), server_default=utcnow())
+    updated_at = Column(DateTime, default=utcnow(), server_default=utcnow(), onupdate=utcnow())
     
-    # Relationships
-    items = relationship("RFPItemModel", back_populates="rfp", cascade="all, delete-orphan")
-    test_requirements = relationship("RFPTestRequirementModel", back_populates="rfp", cascade="all, delete-orphan")
-    responses = relationship("RFPResponseModel", back_populates="rfp", cascade="all, delete-orphan")
+    # Relationships (children serialized by the API are loaded with one IN query per page)
+    items = relationship("RFPItemModel", back_populates="rfp", cascade="all, delete-orphan", lazy="selectin")
+    test_requirements = relationship("RFPTestRequirementModel", back_populates="rfp", cascade="all, delete-orphan", lazy="selectin")
+    responses = relationship("RFPResponseModel", back_populates="rfp", cascade="all, delete-orphan")  # Not eager: large JSON blobs
 
 
 class RFPItemModel(Base):
     """RFP scope of supply items database model."""
     
     __tablename__ = "rfp_items"
+    __table_args__ = (_jsonb_gin_index("ix_rfp_items_specs_gin", "specs"),)
     
     item_id = Column(String(50), primary_key=True, index=True)
     rfp_id = Column(String(50), ForeignKey("rfps.rfp_id"), index=True)
     description = Column(Text)
     quantity = Column(Float)
     unit = Column(String(100))
-    specs = Column(JSON, default={})
-    created_at = Column(DateTime, default=datetime.utcnow)
+    specs = Column(JSONDocument, default={})
+    created_at = Column(DateTime, default=utcnow(), server_default=utcnow())
     
     # Relationships
     rfp = relationship("RFPModel", back_populates="items")
@@ -56,7 +102,7 @@ class RFPTestRequirementModel(Base):
     description = Column(Text)
     required_standard = Column(String(255))
     frequency = Column(String(100), nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, default=utcnow(), server_default=utcnow())
     
     # Relationships
     rfp = relationship("RFPModel", back_populates="test_requirements")
@@ -66,31 +112,36 @@ class SKUModel(Base):
     """Product SKU database model."""
     
     __tablename__ = "skus"
+    __table_args__ = (
+        Index("ix_skus_category_product_name", "category", "product_name"),
+        _jsonb_gin_index("ix_skus_raw_record_gin", "raw_record"),
+    )
     
     sku_id = Column(String(50), primary_key=True, index=True)
     product_name = Column(String(500), index=True)
-    category = Column(String(100), index=True)
+    category = Column(String(100))  # Leading column of ix_skus_category_product_name
     description = Column(Text, nullable=True)
-    raw_record = Column(JSON, default={})
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    raw_record = Column(JSONDocument, default={})
+    created_at = Column(DateTime, default=utcnow(), server_default=utcnow())
+    updated_at = Column(DateTime, default=utcnow(), server_default=utcnow(), onupdate=utcnow())
     
     # Relationships
-    features = relationship("SKUFeatureModel", back_populates="sku", cascade="all, delete-orphan")
-    pricing = relationship("SKUPricingModel", back_populates="sku", cascade="all, delete-orphan")
+    features = relationship("SKUFeatureModel", back_populates="sku", cascade="all, delete-orphan", lazy="selectin")
+    pricing = relationship("SKUPricingModel", back_populates="sku", cascade="all, delete-orphan", lazy="selectin")
 
 
 class SKUFeatureModel(Base):
     """SKU features/specifications database model."""
     
     __tablename__ = "sku_features"
+    __table_args__ = (Index("ix_sku_features_sku_id_name", "sku_id", "name"),)
     
     feature_id = Column(Integer, primary_key=True, autoincrement=True)
-    sku_id = Column(String(50), ForeignKey("skus.sku_id"), index=True)
+    sku_id = Column(String(50), ForeignKey("skus.sku_id"))  # Leading column of ix_sku_features_sku_id_name
     name = Column(String(255), index=True)
     value = Column(String(500))
     unit = Column(String(100), nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, default=utcnow(), server_default=utcnow())
     
     # Relationships
     sku = relationship("SKUModel", back_populates="features")
@@ -105,8 +156,8 @@ class SKUPricingModel(Base):
     sku_id = Column(String(50), ForeignKey("skus.sku_id"), index=True)
     unit_price = Column(Float)
     currency = Column(String(10), default="INR")
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, default=utcnow(), server_default=utcnow())
+    updated_at = Column(DateTime, default=utcnow(), server_default=utcnow(), onupdate=utcnow())
     
     # Relationships
     sku = relationship("SKUModel", back_populates="pricing")
@@ -119,12 +170,12 @@ class TechnicalRecommendationModel(Base):
     
     recommendation_id = Column(Integer, primary_key=True, autoincrement=True)
     item_id = Column(String(50), ForeignKey("rfp_items.item_id"), index=True)
-    top_skus = Column(JSON, default=[])  # List of SKU matches with scores
+    top_skus = Column(JSONDocument, default=[])  # List of SKU matches with scores
     selected_sku_id = Column(String(50), nullable=True)
     spec_match_percent = Column(Float, default=0.0)
     explanation = Column(Text, nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, default=utcnow(), server_default=utcnow())
+    updated_at = Column(DateTime, default=utcnow(), server_default=utcnow(), onupdate=utcnow())
     
     # Relationships
     rfp_item = relationship("RFPItemModel", back_populates="recommendations")
@@ -134,16 +185,18 @@ class PricingBreakdownModel(Base):
     """Pricing breakdown for RFP response database model."""
     
     __tablename__ = "pricing_breakdowns"
+    # Covers the per-RFP total cost aggregation without touching the table
+    __table_args__ = (Index("ix_pricing_breakdowns_item_id_total_cost", "item_id", "total_cost"),)
     
     breakdown_id = Column(Integer, primary_key=True, autoincrement=True)
-    item_id = Column(String(50), ForeignKey("rfp_items.item_id"), index=True)
+    item_id = Column(String(50), ForeignKey("rfp_items.item_id"))
     material_cost = Column(Float)
     testing_cost = Column(Float)
     total_cost = Column(Float)
     cost_per_unit = Column(Float)
     currency = Column(String(10), default="INR")
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, default=utcnow(), server_default=utcnow())
+    updated_at = Column(DateTime, default=utcnow(), server_default=utcnow(), onupdate=utcnow())
 
 
 class RFPResponseModel(Base):
@@ -155,11 +208,11 @@ class RFPResponseModel(Base):
     rfp_id = Column(String(50), ForeignKey("rfps.rfp_id"), index=True)
     status = Column(String(50), default="draft", index=True)  # draft, submitted, accepted, rejected
     sales_summary = Column(Text, nullable=True)
-    technical_response = Column(JSON, nullable=True)
-    pricing_response = Column(JSON, nullable=True)
+    technical_response = Column(JSONDocument, nullable=True)
+    pricing_response = Column(JSONDocument, nullable=True)
     final_narrative = Column(Text, nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, default=utcnow(), server_default=utcnow())
+    updated_at = Column(DateTime, default=utcnow(), server_default=utcnow(), onupdate=utcnow())
     submitted_at = Column(DateTime, nullable=True)
     
     # Relationships
@@ -1,9 +1,9 @@
 """LLM client abstraction for unified LLM interactions using Google Gemini."""
 
-import json
 import logging
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Type
-from pydantic import BaseModel
+from pydantic import BaseModel, ValidationError
 from google import genai 
 
 from ..config import settings
@@ -11,6 +11,32 @@ from ..config import settings
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=128)
+def _json_schema(schema: Type[BaseModel]) -> Dict[str, Any]:
+    """Generate the JSON schema for a schema class once and reuse it.
+    
+    Args:
+        schema: Pydantic model class
+        
+    Returns:
+        JSON schema dictionary
+    """
+    return schema.model_json_schema()
+
+
+@lru_cache(maxsize=4)
+def _get_genai_client(api_key: Optional[str]) -> genai.Client:
+    """Get a shared Gemini client per API key so agents reuse one HTTP session.
+    
+    Args:
+        api_key: Google API key, or None to let the SDK read it from the environment
+        
+    Returns:
+        Gemini client
+    """
+    return genai.Client(api_key=api_key) if api_key else genai.Client()
+
+
 class LLMClient:
     """Unified client for LLM interactions using Google Gemini."""
     
@@ -24,8 +50,10 @@ class LLMClient:
         self.api_key = api_key or settings.google_api_key
         self.model_name = model or settings.llm_model
 
-        # Configure Gemini client
-        self.client = genai.Client()
+        # Configure Gemini client (shared across LLMClient instances).
+        # The settings placeholder key defers to the SDK's environment lookup.
+        client_key = self.api_key if self.api_key != "dummy_key" else None
+        self.client = _get_genai_client(client_key)
         
         logger.info(f"Initialized LLM client with model: {self.model_name}")
     
@@ -69,6 +97,40 @@ class LLMClient:
             logger.error(f"LLM completion error: {e}")
             raise
     
+    async def achat_completion(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        temperature: float = 0.7,
+        max_tokens: Optional[int] = None,
+    ) -> str:
+        """Async variant of chat_completion using the Gemini async API.
+        
+        Args:
+            system_prompt: System instruction
+            user_prompt: User message
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens in response
+            
+        Returns:
+            LLM response text
+        """
+        try:
+            response = await self.client.aio.models.generate_content(
+                model=self.model_name,
+                contents=f"{system_prompt}\n\n{user_prompt}",
+                config=genai.types.GenerateContentConfig(
+                    temperature=temperature,
+                    max_output_tokens=max_tokens or 8192,
+                )
+            )
+            
+            return response.text
+            
+        except Exception as e:
+            logger.error(f"LLM completion error: {e}")
+            raise
+    
     def structured_output(
         self,
         system_prompt: str,
@@ -87,37 +149,30 @@ class LLMClient:
         Returns:
             Instance of the schema class
         """
-        # Add JSON schema instruction to system prompt
-        json_schema = schema.model_json_schema()
-        enhanced_system_prompt = f"""{system_prompt}
-
-You must respond with valid JSON matching this exact schema:
-{json.dumps(json_schema, indent=2)}
-
-Return ONLY the JSON object, no additional text or markdown formatting."""
-        
+        # Gemini's constrained decoding enforces the schema, so the response
+        # is plain JSON: no schema text in the prompt and no fence stripping.
+        # response_json_schema (rather than response_schema) is used because
+        # Dict[str, Any] fields need additionalProperties support.
+        response_text = None
         try:
-            response_text = self.chat_completion(
-                system_prompt=enhanced_system_prompt,
-                user_prompt=user_prompt,
-                temperature=temperature,
+            response = self.client.models.generate_content(
+                model=self.model_name,
+                contents=f"{system_prompt}\n\n{user_prompt}",
+                config=genai.types.GenerateContentConfig(
+                    temperature=temperature,
+                    max_output_tokens=8192,
+                    response_mime_type="application/json",
+                    response_json_schema=_json_schema(schema),
+                )
             )
             
-            # Parse JSON response
-            # Try to extract JSON if wrapped in markdown code blocks
-            if "```json" in response_text:
-                start = response_text.find("```json") + 7
-                end = response_text.find("```", start)
-                response_text = response_text[start:end].strip()
-            elif "```" in response_text:
-                start = response_text.find("```") + 3
-                end = response_text.find("```", start)
-                response_text = response_text[start:end].strip()
+            if isinstance(response.parsed, schema):
+                return response.parsed
             
-            data = json.loads(response_text)
-            return schema(**data)
+            response_text = response.text
+            return schema.model_validate_json(response_text)
             
-        except json.JSONDecodeError as e:
+        except ValidationError as e:
             logger.error(f"Failed to parse JSON response: {e}")
             logger.error(f"Response text: {response_text}")
             raise
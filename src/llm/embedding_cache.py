@@ -0,0 +1,84 @@
+"""Persistent on-disk cache for query embeddings."""
+
+import hashlib
+import logging
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Dict, List
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+class EmbeddingCache:
+    """SQLite-backed embedding cache keyed by sha256 of namespace and text.
+
+    Vectors are stored as float32 bytes, so a cache hit costs one indexed
+    lookup instead of an embedding API call, and entries survive restarts
+    and are shared between processes.
+    """
+
+    def __init__(self, path: Path, namespace: str):
+        """Open (or create) the cache database.
+
+        Args:
+            path: SQLite database file
+            namespace: Prefix mixed into every key (e.g. model and input type),
+                so embeddings from different models never collide
+        """
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.namespace = namespace
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(path), check_same_thread=False, timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS embeddings (key BLOB PRIMARY KEY, vec BLOB NOT NULL)"
+        )
+        self._conn.commit()
+        logger.info(f"Embedding cache opened at {path}")
+
+    def _key(self, text: str) -> bytes:
+        return hashlib.sha256(f"{self.namespace}\0{text}".encode("utf-8")).digest()
+
+    def get_many(self, texts: List[str]) -> Dict[str, List[float]]:
+        """Look up cached embeddings.
+
+        Args:
+            texts: Texts to look up
+
+        Returns:
+            Mapping of text to embedding for the texts found in the cache
+        """
+        if not texts:
+            return {}
+
+        keys = {self._key(text): text for text in texts}
+        placeholders = ",".join("?" * len(keys))
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT key, vec FROM embeddings WHERE key IN ({placeholders})",
+                list(keys)
+            ).fetchall()
+
+        return {
+            keys[key]: np.frombuffer(vec, dtype=np.float32).tolist()
+            for key, vec in rows
+        }
+
+    def put_many(self, embeddings: Dict[str, List[float]]) -> None:
+        """Store embeddings, replacing existing entries.
+
+        Args:
+            embeddings: Mapping of text to embedding
+        """
+        rows = [
+            (self._key(text), np.asarray(vec, dtype=np.float32).tobytes())
+            for text, vec in embeddings.items()
+        ]
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO embeddings (key, vec) VALUES (?, ?)", rows
+            )
+            self._conn.commit()
@@ -1,18 +1,58 @@
 """Retrieval layer for vector search using Cohere embeddings and Qdrant."""
 
 import logging
-from typing import List, Optional
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
 
+import httpx
 from qdrant_client import QdrantClient
+from qdrant_client.models import QuantizationSearchParams, QueryRequest, SearchParams
 import cohere
 
 from ..config import settings
+from .embedding_cache import EmbeddingCache
 from ..models.rfp_models import RFPItem
-from ..models.sku_models import SKU
-from ..data_ingestion.sku_loader import load_skus
 
 logger = logging.getLogger(__name__)
 
+# Number of query embeddings kept in the per-retriever LRU cache
+QUERY_EMBEDDING_CACHE_SIZE = 1024
+
+QUERY_EMBEDDING_MODEL = "embed-v4.0"
+
+# Keep-alive pool for Qdrant queries so per-item searches reuse TLS
+# connections instead of handshaking each time
+HTTP_POOL_LIMITS = httpx.Limits(max_connections=50, max_keepalive_connections=20)
+QDRANT_TIMEOUT = 30
+
+
+def _search_params() -> SearchParams:
+    """Search params for SKU queries.
+    
+    Sets the HNSW search width and, when the collection is quantized, rescores
+    quantized candidates with the original vectors.
+    
+    Returns:
+        SearchParams for query_points / QueryRequest
+    """
+    quantization = None
+    if settings.qdrant_binary_quantization or settings.qdrant_int8_quantization:
+        quantization = QuantizationSearchParams(
+            rescore=True,
+            oversampling=settings.qdrant_rescore_oversampling
+        )
+    return SearchParams(hnsw_ef=settings.qdrant_hnsw_ef, quantization=quantization)
+
+
+def _response_embeddings(response) -> List[List[float]]:
+    """Read the configured embedding type from a Cohere V2 embed response.
+    
+    int8 embeddings are returned as integer lists, which Qdrant accepts as-is.
+    """
+    embedding_type = settings.cohere_embedding_type
+    return getattr(response.embeddings, "float_" if embedding_type == "float" else embedding_type)
+
 
 class SKURetriever:
     """Retriever for SKU product specifications using Cohere and Qdrant."""
@@ -22,10 +62,19 @@ class SKURetriever:
         self.qdrant_client = QdrantClient(
             url=settings.qdrant_url,
             api_key=settings.qdrant_api_key,
-            prefer_grpc=False
+            prefer_grpc=settings.qdrant_prefer_grpc,
+            grpc_port=settings.qdrant_grpc_port,
+            timeout=QDRANT_TIMEOUT,
+            limits=HTTP_POOL_LIMITS
         )
+        # The SDK's own httpx client already keeps connections alive and carries
+        # its default request timeout (a custom httpx_client would replace both)
         self.cohere_client = cohere.ClientV2(api_key=settings.cohere_api_key)
         self.collection_name = "sku_index"
+        self._query_embedding_cache: "OrderedDict[str, List[float]]" = OrderedDict()
+        self._query_embedding_cache_lock = threading.Lock()
+        self._fallback_candidates: Optional[Tuple[dict, ...]] = None
+        self._embedding_store = self._open_embedding_store()
         logger.info(f"SKU Retriever initialized (Qdrant: {settings.qdrant_url})")
     
     def get_sku_candidates(
@@ -45,98 +94,261 @@ class SKURetriever:
         try:
             # Build query from RFP item
             query = self._build_query(rfp_item)
-            logger.info(f"Searching for SKUs with query: {query}")
+            logger.info("Searching for SKUs with query: %s", query)
             
             # Generate query embedding using Cohere
-            query_response = self.cohere_client.embed(
-                model="embed-v4.0",
-                input_type="search_query",
-                texts=[query]
-            )
-            query_embedding = query_response.embeddings[0]
-            logger.info(f"Generated query embedding (dimension: {len(query_embedding)})")
+            query_embedding = self._embed_queries([query])[0]
+            logger.debug("Generated query embedding (dimension: %d)", len(query_embedding))
             
             # Search in Qdrant
-            search_result = self.qdrant_client.search(
+            search_result = self.qdrant_client.query_points(
                 collection_name=self.collection_name,
-                query_vector=query_embedding,
-                limit=top_k
-            )
+                query=query_embedding,
+                limit=top_k,
+                with_payload=True,
+                search_params=_search_params()
+            ).points
             
-            logger.info(f"Found {len(search_result)} candidate points")
+            candidates = self._points_to_candidates(search_result)
             
-            # Convert search results to SKU candidates
-            candidates = []
-            for point in search_result:
-                metadata = point.payload.get("metadata", {})
-                candidates.append({
-                    "sku_id": metadata.get("sku_id", ""),
-                    "product_name": metadata.get("product_name", ""),
-                    "category": metadata.get("category", ""),
-                    "features": metadata.get("features", {}),
-                    "score": point.score,  # Similarity score
-                    "text": point.payload.get("text", "")
-                })
-            
-            logger.info(f"Returning {len(candidates)} SKU candidates")
+            logger.debug("Returning %d SKU candidates", len(candidates))
             return candidates
             
         except Exception as e:
-            logger.error(f"Error retrieving SKU candidates: {e}")
-            logger.warning("Falling back to CSV-based retrieval")
+            logger.warning("Error retrieving SKU candidates (%r); falling back to CSV-based retrieval", e)
             return self._fallback_get_all_skus()
     
+    def get_sku_candidates_batch(
+        self,
+        rfp_items: List[RFPItem],
+        top_k: int = 10
+    ) -> List[List[dict]]:
+        """Retrieve candidate SKUs for several RFP items in one round-trip each.
+        
+        All queries are embedded with a single Cohere call and searched with a
+        single Qdrant batch query.
+        
+        Args:
+            rfp_items: RFP items to match
+            top_k: Number of candidates to return per item
+            
+        Returns:
+            One list of SKU candidate dictionaries per RFP item, in input order
+        """
+        if not rfp_items:
+            return []
+        
+        try:
+            queries = [self._build_query(item) for item in rfp_items]
+            logger.info("Searching for SKUs with %d batched queries", len(queries))
+            
+            query_embeddings = self._embed_queries(queries)
+            
+            search_params = _search_params()
+            responses = self.qdrant_client.query_batch_points(
+                collection_name=self.collection_name,
+                requests=[
+                    QueryRequest(query=embedding, limit=top_k, with_payload=True, params=search_params)
+                    for embedding in query_embeddings
+                ]
+            )
+            
+            return [self._points_to_candidates(response.points) for response in responses]
+            
+        except Exception as e:
+            logger.warning(
+                "Error retrieving SKU candidates in batch (%r); falling back to CSV-based retrieval", e
+            )
+            fallback = self._fallback_get_all_skus()
+            return [list(fallback) for _ in rfp_items]
+    
+    def _embed_queries(self, queries: List[str]) -> List[List[float]]:
+        """Embed search queries with Cohere, reusing cached embeddings.
+        
+        Queries missing from the LRU cache are embedded together in a single
+        request; repeated spec lines across RFPs skip the network call. The
+        result is assembled from a local dict, so entries evicted by other
+        threads in the meantime don't matter.
+        
+        Args:
+            queries: Query strings
+            
+        Returns:
+            One embedding per query
+        """
+        embeddings, misses = self._lookup_embeddings(queries)
+        if misses:
+            response = self.cohere_client.embed(
+                model=QUERY_EMBEDDING_MODEL,
+                input_type="search_query",
+                texts=misses,
+                embedding_types=[settings.cohere_embedding_type]
+            )
+            fresh = dict(zip(misses, _response_embeddings(response)))
+            embeddings.update(fresh)
+            self._cache_embeddings(fresh)
+        
+        return [embeddings[query] for query in queries]
+    
+    def _open_embedding_store(self) -> Optional[EmbeddingCache]:
+        """Open the on-disk query embedding cache, if enabled and writable."""
+        if not settings.query_embedding_disk_cache:
+            return None
+        try:
+            return EmbeddingCache(
+                settings.get_query_embedding_cache_path(),
+                namespace=f"{QUERY_EMBEDDING_MODEL}:{settings.cohere_embedding_type}:search_query"
+            )
+        except Exception as e:
+            logger.warning(f"Query embedding disk cache disabled: {e}")
+            return None
+    
+    def _lookup_embeddings(self, queries: List[str]) -> Tuple[Dict[str, List[float]], List[str]]:
+        """Look up query embeddings in memory, then on disk.
+        
+        Embeddings found on disk are promoted into the in-memory LRU cache.
+        
+        Args:
+            queries: Query strings
+            
+        Returns:
+            Tuple of (embeddings found by query, distinct queries still missing)
+        """
+        found: Dict[str, List[float]] = {}
+        with self._query_embedding_cache_lock:
+            cache = self._query_embedding_cache
+            for query in dict.fromkeys(queries):
+                embedding = cache.get(query)
+                if embedding is not None:
+                    cache.move_to_end(query)
+                    found[query] = embedding
+        misses = [q for q in dict.fromkeys(queries) if q not in found]
+        
+        if misses and self._embedding_store is not None:
+            try:
+                persisted = self._embedding_store.get_many(misses)
+            except Exception as e:
+                logger.warning(f"Query embedding disk cache read failed: {e}")
+                persisted = {}
+            found.update(persisted)
+            self._remember_embeddings(persisted)
+            misses = [q for q in misses if q not in persisted]
+        
+        return found, misses
+    
+    def _cache_embeddings(self, fresh: Dict[str, List[float]]) -> None:
+        """Store freshly computed query embeddings in memory and on disk."""
+        self._remember_embeddings(fresh)
+        
+        if self._embedding_store is not None:
+            try:
+                self._embedding_store.put_many(fresh)
+            except Exception as e:
+                logger.warning(f"Query embedding disk cache write failed: {e}")
+    
+    def _remember_embeddings(self, embeddings: Dict[str, List[float]]) -> None:
+        """Add embeddings to the in-memory LRU cache and evict the oldest entries."""
+        if not embeddings:
+            return
+        with self._query_embedding_cache_lock:
+            cache = self._query_embedding_cache
+            for query, embedding in embeddings.items():
+                cache[query] = embedding
+                cache.move_to_end(query)
+            while len(cache) > QUERY_EMBEDDING_CACHE_SIZE:
+                cache.popitem(last=False)
+    
+    def _points_to_candidates(self, points) -> List[dict]:
+        """Convert Qdrant scored points to SKU candidate dictionaries.
+        
+        Args:
+            points: Scored points returned by Qdrant
+            
+        Returns:
+            List of SKU candidate dictionaries
+        """
+        candidates = []
+        for point in points:
+            metadata = point.payload.get("metadata", {})
+            candidates.append({
+                "sku_id": metadata.get("sku_id", ""),
+                "product_name": metadata.get("product_name", ""),
+                "category": metadata.get("category", ""),
+                "features": metadata.get("features", {}),
+                "score": point.score,  # Similarity score
+                "text": point.payload.get("text", "")
+            })
+        return candidates
+    
     def _fallback_get_all_skus(self) -> List[dict]:
         """Fallback method to load all SKUs from CSV when Qdrant fails.
         
+        The candidate projection is built on first use and shared afterwards;
+        callers must treat the returned dictionaries as read-only.
+        
         Returns:
             List of all SKUs as dictionaries
         """
-        try:
-            repository = load_skus()
-            candidates = []
-            for sku in repository.skus:
-                candidates.append({
-                    "sku_id": sku.sku_id,
-                    "product_name": sku.product_name,
-                    "category": sku.category,
-                    "features": {f.name: str(f.value) for f in sku.features},
-                    "score": 0.5,  # Neutral score for fallback
-                    "text": f"{sku.product_name} {sku.category}"
-                })
-            logger.info(f"Fallback: Loaded {len(candidates)} SKUs from CSV")
-            return candidates
-        except Exception as e:
-            logger.error(f"Error in fallback SKU loading: {e}")
-            return []
+        if self._fallback_candidates is None:
+            try:
+                # Imported here so the CSV loader is only pulled in when Qdrant fails
+                from ..data_ingestion.sku_loader import load_skus
+                
+                repository = load_skus()
+                self._fallback_candidates = tuple(
+                    {
+                        "sku_id": sku.sku_id,
+                        "product_name": sku.product_name,
+                        "category": sku.category,
+                        "features": {f.name: str(f.value) for f in sku.features},
+                        "score": 0.5,  # Neutral score for fallback
+                        "text": f"{sku.product_name} {sku.category}"
+                    }
+                    for sku in repository.skus
+                )
+                logger.info(f"Fallback: Loaded {len(self._fallback_candidates)} SKUs from CSV")
+            except Exception as e:
+                logger.error(f"Error in fallback SKU loading: {e}")
+                return []
+        return list(self._fallback_candidates)
+    
+    def clear_fallback_cache(self) -> None:
+        """Drop the cached fallback candidates so the SKU catalog is reloaded."""
+        self._fallback_candidates = None
     
     def _build_query(self, rfp_item: RFPItem) -> str:
         """Build search query from RFP item.
         
+        The description is followed by "name: value" specs. Specs with no
+        value (None or blank) are left out, since "name: None" only adds
+        tokens to the embedding input without describing the item. Built on
+        every call so it always reflects the item's current specs; the
+        embedding caches make repeats cheap.
+        
         Args:
             rfp_item: RFP item
             
         Returns:
             Query string
         """
-        parts = [rfp_item.description]
-        
-        # Add specifications to query
-        for spec_name, spec_value in rfp_item.specs.items():
-            parts.append(f"{spec_name}: {spec_value}")
-        
-        return " ".join(parts)
+        return " ".join((
+            rfp_item.description,
+            *(f"{k}: {v}" for k, v in rfp_item.specs.items() if v is not None and str(v).strip())
+        ))
 
 
 # Global retriever (lazy loaded)
 _sku_retriever: Optional[SKURetriever] = None
+_sku_retriever_lock = threading.Lock()
 
 
 def get_sku_retriever() -> SKURetriever:
-    """Get global SKU retriever instance."""
+    """Get global SKU retriever instance (created once per process)."""
     global _sku_retriever
     if _sku_retriever is None:
-        _sku_retriever = SKURetriever()
+        with _sku_retriever_lock:
+            if _sku_retriever is None:
+                _sku_retriever = SKURetriever()
     return _sku_retriever
 
 
@@ -152,3 +364,17 @@ def get_sku_candidates(rfp_item: RFPItem, top_k: int = 10) -> List[dict]:
     """
     retriever = get_sku_retriever()
     return retriever.get_sku_candidates(rfp_item, top_k)
+
+
+def get_sku_candidates_batch(rfp_items: List[RFPItem], top_k: int = 10) -> List[List[dict]]:
+    """Convenience function to get SKU candidates for several RFP items.
+    
+    Args:
+        rfp_items: RFP items to match
+        top_k: Number of candidates per item
+        
+    Returns:
+        One list of candidate SKUs per RFP item
+    """
+    retriever = get_sku_retriever()
+    return retriever.get_sku_candidates_batch(rfp_items, top_k)
@@ -5,10 +5,12 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
 from fastapi.responses import JSONResponse
 from contextlib import asynccontextmanager
+import asyncio
 import logging
 from datetime import datetime
 
 from src.db.database import init_db
+from src.llm.retrieval import get_sku_retriever
 from src.api.routes import (
     health_routes,
     rfp_routes,
@@ -36,6 +38,14 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.error(f"❌ Error initializing database: {e}")
     
+    # Build the retriever singleton (clients, embedding cache) now so the
+    # first request does not pay for it
+    try:
+        await asyncio.to_thread(get_sku_retriever)
+        logger.info("✅ SKU retriever warmed up")
+    except Exception as e:
+        logger.warning(f"⚠️ SKU retriever warm-up failed: {e}")
+    
     yield
     
     # Shutdown
@@ -1,7 +1,7 @@
 """Pricing domain models."""
 
-from typing import List
-from pydantic import BaseModel, Field
+from typing import Dict, List
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class PricingLine(BaseModel):
@@ -11,14 +11,16 @@ class PricingLine(BaseModel):
     unit_price: float = Field(..., description="Price per unit", gt=0)
     currency: str = Field(default="INR", description="Currency code")
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "sku_id": "SKU-CABLE-001",
                 "unit_price": 1250.50,
                 "currency": "INR"
             }
-        }
+        },
+        frozen=True
+    )
 
 
 class TestPricingLine(BaseModel):
@@ -28,14 +30,16 @@ class TestPricingLine(BaseModel):
     price: float = Field(..., description="Test price", gt=0)
     currency: str = Field(default="INR", description="Currency code")
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "test_name": "Routine Tests",
                 "price": 5000.00,
                 "currency": "INR"
             }
-        }
+        },
+        frozen=True
+    )
 
 
 class PricingTables(BaseModel):
@@ -59,7 +63,34 @@ class PricingTables(BaseModel):
     
     def get_test_price(self, test_name: str) -> float | None:
         """Get price for a specific test."""
+        test_name = test_name.lower()
         for line in self.test_pricing:
-            if line.test_name.lower() == test_name.lower():
+            if line.test_name.lower() == test_name:
                 return line.price
         return None
+    
+    def get_product_prices(self, sku_ids: List[str]) -> Dict[str, float]:
+        """Get unit prices for several SKUs; SKUs without a price are omitted.
+        
+        The table is indexed once per call (first line wins), so the result
+        always reflects its current contents.
+        """
+        price_by_sku: Dict[str, float] = {}
+        for line in self.product_pricing:
+            price_by_sku.setdefault(line.sku_id, line.unit_price)
+        return {sku_id: price_by_sku[sku_id] for sku_id in sku_ids if sku_id in price_by_sku}
+    
+    def get_test_prices(self, test_names: List[str]) -> Dict[str, float]:
+        """Get prices for several tests; tests without a price are omitted.
+        
+        Matching is case-insensitive and the table is indexed once per call
+        (first line wins).
+        """
+        price_by_test: Dict[str, float] = {}
+        for line in self.test_pricing:
+            price_by_test.setdefault(line.test_name.lower(), line.price)
+        return {
+            test_name: price_by_test[test_name.lower()]
+            for test_name in test_names
+            if test_name.lower() in price_by_test
+        }
@@ -2,7 +2,7 @@
 
 from datetime import datetime
 from typing import Any, Dict, List, Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class RFPItem(BaseModel):
@@ -17,8 +17,8 @@ class RFPItem(BaseModel):
         description="Technical specifications as key-value pairs"
     )
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "item_id": "ITEM-001",
                 "description": "3.5 Core 240 sq.mm XLPE Insulated Armoured Cable",
@@ -32,6 +32,7 @@ class RFPItem(BaseModel):
                 }
             }
         }
+    )
 
 
 class RFPTestRequirement(BaseModel):
@@ -42,8 +43,8 @@ class RFPTestRequirement(BaseModel):
     required_standard: str = Field(..., description="Required standard (e.g., 'IS: 7098 Part 1')")
     frequency: Optional[str] = Field(None, description="Testing frequency (e.g., 'per lot')")
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "test_name": "Routine Tests",
                 "description": "Standard electrical and mechanical tests",
@@ -51,6 +52,7 @@ class RFPTestRequirement(BaseModel):
                 "frequency": "per lot"
             }
         }
+    )
 
 
 class RFP(BaseModel):
@@ -72,8 +74,8 @@ class RFP(BaseModel):
     )
     raw_text: Optional[str] = Field(None, description="Raw RFP text for reference")
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "rfp_id": "RFP-2025-001",
                 "title": "Supply of Power Cables for Substation Project",
@@ -85,3 +87,4 @@ class RFP(BaseModel):
                 "test_requirements": []
             }
         }
+    )
@@ -1,7 +1,7 @@
 """SKU and product specification models."""
 
 from typing import Any, Dict, List, Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class SKUFeature(BaseModel):
@@ -11,14 +11,16 @@ class SKUFeature(BaseModel):
     value: str = Field(..., description="Feature value (e.g., 'Aluminium')")
     unit: Optional[str] = Field(None, description="Unit of measurement if applicable")
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "name": "Conductor Material",
                 "value": "Aluminium",
                 "unit": None
             }
-        }
+        },
+        frozen=True
+    )
 
 
 class SKU(BaseModel):
@@ -52,8 +54,8 @@ class SKU(BaseModel):
             "features": {f.name: f.value for f in self.features}
         }
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "sku_id": "SKU-CABLE-001",
                 "product_name": "XLPE Insulated Armoured Cable 3.5C x 240 sq.mm",
@@ -66,6 +68,7 @@ class SKU(BaseModel):
                 ]
             }
         }
+    )
 
 
 class SKURepository(BaseModel):
@@ -82,7 +85,8 @@ class SKURepository(BaseModel):
     
     def get_by_category(self, category: str) -> List[SKU]:
         """Get all SKUs in a specific category."""
-        return [sku for sku in self.skus if sku.category.lower() == category.lower()]
+        category = category.lower()
+        return [sku for sku in self.skus if sku.category.lower() == category]
     
     def add_sku(self, sku: SKU) -> None:
         """Add a SKU to the repository."""
@@ -3,6 +3,8 @@
 import logging
 from typing import List, Dict, Any
 
+import numpy as np
+
 from ..models.rfp_models import RFP, RFPItem, RFPTestRequirement
 from ..models.pricing_models import PricingTables
 from ..api.schema import TechnicalAgentOutput, PricingResultLine, PricingAgentOutput
@@ -35,55 +37,91 @@ class PricingService:
         Returns:
             Pricing agent output with detailed costs
         """
-        lines: List[PricingResultLine] = []
-        total_material_cost = 0.0
         total_test_cost = 0.0
         
-        # Calculate material costs per item
+        # Calculate test costs
+        price_by_test = self.pricing_tables.get_test_prices(
+            [test_req.test_name for test_req in rfp.test_requirements]
+        )
+        for test_req in rfp.test_requirements:
+            test_price = price_by_test.get(test_req.test_name)
+            if test_price is None:
+                logger.warning(f"No price found for test: {test_req.test_name}")
+                test_price = 0.0
+            
+            total_test_cost += test_price
+        
+        # Index items once so each recommendation is an O(1) lookup
+        items_by_id = self._index_rfp_items(rfp)
+        
+        # Resolve each recommendation to its RFP item
+        priced_items: List[RFPItem] = []
+        sku_ids: List[str] = []
         for recommendation in technical_output.recommendations:
-            rfp_item = self._find_rfp_item(rfp, recommendation.rfp_item_id)
+            rfp_item = items_by_id.get(recommendation.rfp_item_id)
             if not rfp_item:
                 logger.warning(f"RFP item {recommendation.rfp_item_id} not found")
                 continue
             
-            sku_id = recommendation.selected_best_sku_id
-            unit_price = self.pricing_tables.get_product_price(sku_id)
-            
+            priced_items.append(rfp_item)
+            sku_ids.append(recommendation.selected_best_sku_id)
+        
+        # Nothing to price: only the test costs apply
+        if not priced_items:
+            return PricingAgentOutput(
+                rfp_id=rfp.rfp_id,
+                lines=[],
+                total_material_cost=0.0,
+                total_test_cost=total_test_cost,
+                grand_total=total_test_cost
+            )
+        
+        # Look up all unit prices in one call
+        price_by_sku = self.pricing_tables.get_product_prices(sku_ids)
+        unit_prices: List[float] = []
+        for sku_id in sku_ids:
+            unit_price = price_by_sku.get(sku_id)
             if unit_price is None:
                 logger.warning(f"No price found for SKU {sku_id}")
                 unit_price = 0.0
-            
-            material_cost = rfp_item.quantity * unit_price
-            total_material_cost += material_cost
-            
-            # Create pricing line (test cost allocated later)
-            line = PricingResultLine(
+            unit_prices.append(unit_price)
+        
+        # Material costs for all lines in one array operation
+        quantities = np.fromiter(
+            (item.quantity for item in priced_items), dtype=np.float64, count=len(priced_items)
+        )
+        material_costs = quantities * np.asarray(unit_prices, dtype=np.float64)
+        total_material_cost = float(material_costs.sum())
+        
+        # Allocate test costs proportionally to material cost (evenly if there is none)
+        allocated_test_costs = np.zeros(len(priced_items))
+        if priced_items and total_test_cost > 0:
+            if total_material_cost > 0:
+                proportions = material_costs / total_material_cost
+            else:
+                proportions = np.full(len(priced_items), 1.0 / len(priced_items))
+            allocated_test_costs = total_test_cost * proportions
+        total_costs = material_costs + allocated_test_costs
+        
+        lines = [
+            PricingResultLine(
                 rfp_item_id=rfp_item.item_id,
                 sku_id=sku_id,
                 quantity=rfp_item.quantity,
                 unit_price=unit_price,
                 material_cost=material_cost,
-                allocated_test_cost=0.0,  # Will be allocated
-                total_cost=material_cost
+                allocated_test_cost=allocated_test_cost,
+                total_cost=total_cost
             )
-            lines.append(line)
-        
-        # Calculate test costs
-        for test_req in rfp.test_requirements:
-            test_price = self.pricing_tables.get_test_price(test_req.test_name)
-            if test_price is None:
-                logger.warning(f"No price found for test: {test_req.test_name}")
-                test_price = 0.0
-            
-            total_test_cost += test_price
-        
-        # Allocate test costs proportionally across items
-        if lines and total_test_cost > 0:
-            for line in lines:
-                # Allocate based on material cost proportion
-                proportion = line.material_cost / total_material_cost if total_material_cost > 0 else 1.0 / len(lines)
-                line.allocated_test_cost = total_test_cost * proportion
-                line.total_cost = line.material_cost + line.allocated_test_cost
+            for rfp_item, sku_id, unit_price, material_cost, allocated_test_cost, total_cost in zip(
+                priced_items,
+                sku_ids,
+                unit_prices,
+                material_costs.tolist(),
+                allocated_test_costs.tolist(),
+                total_costs.tolist()
+            )
+        ]
         
         grand_total = total_material_cost + total_test_cost
         
@@ -95,20 +133,21 @@ class PricingService:
             grand_total=grand_total
         )
     
-    def _find_rfp_item(self, rfp: RFP, item_id: str) -> RFPItem | None:
-        """Find RFP item by ID.
+    def _index_rfp_items(self, rfp: RFP) -> Dict[str, RFPItem]:
+        """Map RFP item IDs to items.
+        
+        Built per call so it always reflects the RFP's current items.
         
         Args:
             rfp: RFP object
-            item_id: Item ID
             
         Returns:
-            RFP item or None
+            Dict of item ID to RFP item (first item wins on duplicate IDs)
         """
+        items_by_id: Dict[str, RFPItem] = {}
         for item in rfp.scope_of_supply:
-            if item.item_id == item_id:
-                return item
-        return None
+            items_by_id.setdefault(item.item_id, item)
+        return items_by_id
 
 
 def get_pricing_service(pricing_tables: PricingTables) -> PricingService:
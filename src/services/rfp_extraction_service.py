@@ -1,10 +1,14 @@
 """RFP extraction and conversion service."""
 
+import asyncio
+import hashlib
 import logging
 import json
+import threading
 import uuid
 import re
-from typing import Dict, Any, List, Optional
+from collections import OrderedDict
+from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime
 
 from ..llm.client import LLMClient
@@ -13,6 +17,45 @@ from .pdf_parser_service import PDFParserService
 
 logger = logging.getLogger(__name__)
 
+# Number of LLM parse results kept in memory, keyed by model and prompt text
+PARSE_CACHE_SIZE = 256
+# Characters of document text sent to the LLM (and hashed for the cache key)
+PARSE_TEXT_LIMIT = 5000
+# Default number of PDFs processed at once by process_rfp_pdfs_async
+PDF_PIPELINE_CONCURRENCY = 4
+
+# Markdown code fence (```json ... ```) around an LLM JSON reply; either fence may be missing
+_CODE_FENCE_RE = re.compile(r'^\s*(?:```(?:json)?)?\s*(.*?)\s*(?:```)?\s*$', re.DOTALL)
+
+# Parsed results are stored as JSON strings so callers always get a fresh copy
+_parse_cache: "OrderedDict[str, str]" = OrderedDict()
+_parse_cache_lock = threading.Lock()
+
+
+def _get_cached_parse(key: str) -> Optional[Dict[str, Any]]:
+    """Look up a cached LLM parse result, marking it most recently used."""
+    with _parse_cache_lock:
+        cached = _parse_cache.get(key)
+        if cached is None:
+            return None
+        _parse_cache.move_to_end(key)
+    return json.loads(cached)
+
+
+def _cache_parse(key: str, rfp_data: Dict[str, Any]) -> None:
+    """Store an LLM parse result, evicting the least recently used entries."""
+    with _parse_cache_lock:
+        _parse_cache[key] = json.dumps(rfp_data)
+        _parse_cache.move_to_end(key)
+        while len(_parse_cache) > PARSE_CACHE_SIZE:
+            _parse_cache.popitem(last=False)
+
+
+def clear_parse_cache() -> None:
+    """Drop all cached LLM parse results."""
+    with _parse_cache_lock:
+        _parse_cache.clear()
+
 
 class RFPExtractionService:
     """Service for extracting RFP data from PDF and converting to SKU format."""
@@ -79,6 +122,9 @@ class RFPExtractionService:
     def _parse_rfp_with_llm(self, text: str, filename: str) -> Dict[str, Any]:
         """Parse RFP text using LLM.
         
+        Results are cached by a hash of the model and the text sent to it, so
+        re-uploading the same document skips the LLM call.
+        
         Args:
             text: Text to parse
             filename: Original filename
@@ -86,6 +132,74 @@ class RFPExtractionService:
         Returns:
             Parsed RFP data
         """
+        prompt_text = text[:PARSE_TEXT_LIMIT]
+        cache_key = self._parse_cache_key(prompt_text)
+        cached = _get_cached_parse(cache_key)
+        if cached is not None:
+            logger.info(f"Using cached LLM parse for {filename}")
+            return cached
+        
+        system_prompt, user_prompt = self._build_parse_prompts(prompt_text)
+        
+        try:
+            response = self.llm_client.chat_completion(
+                system_prompt=system_prompt,
+                user_prompt=user_prompt,
+                temperature=0.3,  # Lower temperature for more consistent parsing
+                max_tokens=2000
+            )
+            return self._decode_parse_response(response, cache_key)
+        except Exception as e:
+            logger.error(f"LLM parsing error: {e}")
+            raise
+    
+    async def _aparse_rfp_with_llm(self, text: str, filename: str) -> Dict[str, Any]:
+        """Async variant of _parse_rfp_with_llm using the async LLM API.
+        
+        Args:
+            text: Text to parse
+            filename: Original filename
+            
+        Returns:
+            Parsed RFP data
+        """
+        prompt_text = text[:PARSE_TEXT_LIMIT]
+        cache_key = self._parse_cache_key(prompt_text)
+        cached = _get_cached_parse(cache_key)
+        if cached is not None:
+            logger.info(f"Using cached LLM parse for {filename}")
+            return cached
+        
+        system_prompt, user_prompt = self._build_parse_prompts(prompt_text)
+        
+        try:
+            response = await self.llm_client.achat_completion(
+                system_prompt=system_prompt,
+                user_prompt=user_prompt,
+                temperature=0.3,  # Lower temperature for more consistent parsing
+                max_tokens=2000
+            )
+            return self._decode_parse_response(response, cache_key)
+        except Exception as e:
+            logger.error(f"LLM parsing error: {e}")
+            raise
+    
+    def _parse_cache_key(self, prompt_text: str) -> str:
+        """Cache key for an LLM parse: hash of the model and the prompt text."""
+        return hashlib.blake2b(
+            f"{self.llm_client.model_name}\0{prompt_text}".encode("utf-8"),
+            digest_size=16
+        ).hexdigest()
+    
+    def _build_parse_prompts(self, prompt_text: str) -> Tuple[str, str]:
+        """Build the system and user prompts for RFP parsing.
+        
+        Args:
+            prompt_text: Document text (already truncated) to embed in the prompt
+            
+        Returns:
+            Tuple of (system_prompt, user_prompt)
+        """
         system_prompt = """You are an expert RFP (Request for Proposal) parser. 
 Extract structured information from the provided RFP document text.
 Focus on identifying: product name, category, description, specifications (features), and any pricing information.
@@ -111,39 +225,36 @@ Return a JSON object matching this structure:
 
 RFP Document:
 ---
-{text[:5000]}
+{prompt_text}
 ---
 
 Return only the JSON object, no additional text."""
+        return system_prompt, user_prompt
+    
+    def _decode_parse_response(self, response: str, cache_key: str) -> Dict[str, Any]:
+        """Decode the LLM's JSON reply and cache it.
         
-        try:
-            response = self.llm_client.chat_completion(
-                system_prompt=system_prompt,
-                user_prompt=user_prompt,
-                temperature=0.3,  # Lower temperature for more consistent parsing
-                max_tokens=2000
-            )
+        Args:
+            response: Raw LLM response text
+            cache_key: Parse cache key for this prompt
             
-            # Parse JSON response
+        Returns:
+            Parsed RFP data
+        """
+        # Parse JSON response
+        try:
             try:
+                # Common case: the response is already bare JSON
+                rfp_data = json.loads(response)
+            except json.JSONDecodeError:
                 # Clean response - remove markdown code blocks if present
-                cleaned = response.strip()
-                if cleaned.startswith("```json"):
-                    cleaned = cleaned[7:]
-                if cleaned.startswith("```"):
-                    cleaned = cleaned[3:]
-                if cleaned.endswith("```"):
-                    cleaned = cleaned[:-3]
-                cleaned = cleaned.strip()
-                
+                cleaned = _CODE_FENCE_RE.match(response).group(1)
                 rfp_data = json.loads(cleaned)
-                return rfp_data
-            except json.JSONDecodeError as e:
-                logger.error(f"Failed to parse LLM response as JSON: {e}")
-                logger.debug(f"LLM Response: {response[:500]}")
-                raise
-        except Exception as e:
-            logger.error(f"LLM parsing error: {e}")
+            _cache_parse(cache_key, rfp_data)
+            return rfp_data
+        except json.JSONDecodeError as e:
+            logger.error(f"Failed to parse LLM response as JSON: {e}")
+            logger.debug(f"LLM Response: {response[:500]}")
             raise
     
     def convert_rfp_to_sku(self, rfp_data: Dict[str, Any], sku_id: Optional[str] = None) -> Dict[str, Any]:
@@ -158,6 +269,9 @@ Return only the JSON object, no additional text."""
         """
         logger.info("Converting RFP data to SKU format")
         
+        # One timestamp for every created_at/updated_at in this record
+        now_iso = datetime.utcnow().isoformat()
+        
         # Generate SKU ID if not provided
         if not sku_id:
             sku_id = self._generate_sku_id(rfp_data.get("product_name", "UNKNOWN"))
@@ -201,8 +315,8 @@ Return only the JSON object, no additional text."""
                         "unit_price": unit_price,
                         "currency": "INR",
                         "pricing_id": 0,
-                        "created_at": datetime.utcnow().isoformat(),
-                        "updated_at": datetime.utcnow().isoformat()
+                        "created_at": now_iso,
+                        "updated_at": now_iso
                     })
         
         sku_format = {
@@ -213,8 +327,8 @@ Return only the JSON object, no additional text."""
             "raw_record": rfp_data,  # Store original RFP data
             "features": features,
             "pricing": pricing,
-            "created_at": datetime.utcnow().isoformat(),
-            "updated_at": datetime.utcnow().isoformat()
+            "created_at": now_iso,
+            "updated_at": now_iso
         }
         
         logger.info(f"Successfully converted RFP to SKU format: {sku_id}")
@@ -229,10 +343,10 @@ Return only the JSON object, no additional text."""
         Returns:
             Generated SKU ID
         """
-        # Create slug from product name
-        slug = product_name.upper().replace(" ", "_")[:20]
+        # Create slug from product name (runs of whitespace become one underscore)
+        slug = "_".join(product_name.upper().split())[:20]
         # Add unique identifier
-        unique_id = str(uuid.uuid4())[:8].upper()
+        unique_id = uuid.uuid4().hex[:8].upper()
         sku_id = f"SKU-{slug}-{unique_id}"
         return sku_id
     
@@ -256,3 +370,100 @@ Return only the JSON object, no additional text."""
         
         logger.info(f"RFP processing pipeline complete: {sku_data['sku_id']}")
         return sku_data
+    
+    async def extract_rfp_from_pdf_bytes_async(self, pdf_bytes: bytes, filename: str) -> Dict[str, Any]:
+        """Async variant of extract_rfp_from_pdf_bytes.
+        
+        Text extraction runs in a worker thread and the LLM call uses the async
+        API, so the event loop keeps serving other requests while this one
+        waits.
+        
+        Args:
+            pdf_bytes: PDF file as bytes
+            filename: Original filename for logging
+            
+        Returns:
+            Dictionary containing extracted RFP data
+        """
+        logger.info(f"Extracting RFP from PDF: {filename}")
+        
+        try:
+            pdf_text = await asyncio.to_thread(self.pdf_parser.extract_text_from_bytes, pdf_bytes)
+            logger.info(f"Successfully extracted text from PDF ({len(pdf_text)} chars)")
+        except Exception as e:
+            logger.error(f"Failed to extract text from PDF: {e}")
+            raise
+        
+        try:
+            rfp_data = await self._aparse_rfp_with_llm(pdf_text, filename)
+            logger.info(f"Successfully parsed RFP data from PDF")
+            return rfp_data
+        except Exception as e:
+            logger.error(f"Failed to parse RFP data with LLM: {e}")
+            raise
+    
+    async def extract_rfp_from_text_async(self, text: str, filename: str = "unknown") -> Dict[str, Any]:
+        """Async variant of extract_rfp_from_text using the async LLM API.
+        
+        Args:
+            text: Raw text content
+            filename: Original filename for logging
+            
+        Returns:
+            Dictionary containing extracted RFP data
+        """
+        logger.info(f"Extracting RFP from text: {filename}")
+        
+        try:
+            rfp_data = await self._aparse_rfp_with_llm(text, filename)
+            logger.info(f"Successfully parsed RFP data from text")
+            return rfp_data
+        except Exception as e:
+            logger.error(f"Failed to parse RFP data with LLM: {e}")
+            raise
+    
+    async def process_rfp_pdf_complete_async(self, pdf_bytes: bytes, filename: str) -> Dict[str, Any]:
+        """Async variant of process_rfp_pdf_complete.
+        
+        Args:
+            pdf_bytes: PDF file as bytes
+            filename: Original filename
+            
+        Returns:
+            Final SKU formatted data ready for database insertion
+        """
+        logger.info(f"Starting complete RFP processing pipeline: {filename}")
+        
+        rfp_data = await self.extract_rfp_from_pdf_bytes_async(pdf_bytes, filename)
+        sku_data = self.convert_rfp_to_sku(rfp_data)
+        
+        logger.info(f"RFP processing pipeline complete: {sku_data['sku_id']}")
+        return sku_data
+    
+    async def process_rfp_pdfs_async(
+        self,
+        files: List[Tuple[bytes, str]],
+        max_concurrency: int = PDF_PIPELINE_CONCURRENCY
+    ) -> List[Dict[str, Any]]:
+        """Run the complete pipeline over several PDFs concurrently.
+        
+        PDF parsing for one file overlaps with LLM calls for others; the
+        semaphore bounds how many files are in flight (and so the LLM request
+        rate).
+        
+        Args:
+            files: (pdf_bytes, filename) pairs
+            max_concurrency: Maximum files processed at once
+            
+        Returns:
+            SKU formatted data per file, in input order
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def process(pdf_bytes: bytes, filename: str) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.process_rfp_pdf_complete_async(pdf_bytes, filename)
+        
+        return list(await asyncio.gather(
+            *(process(pdf_bytes, filename) for pdf_bytes, filename in files)
+        ))
@@ -1,13 +1,15 @@
 """RFP parsing service for extracting structured data from RFP documents."""
 
-import json
+import hashlib
 import logging
 import re
+import threading
+from collections import OrderedDict
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
 from dateutil import parser as date_parser
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, NavigableString, SoupStrainer
 
 from ..models.rfp_models import RFP, RFPItem, RFPTestRequirement
 from ..llm.client import LLMClient
@@ -15,6 +17,28 @@ from ..config import settings
 
 logger = logging.getLogger(__name__)
 
+# Dates, optionally introduced by a deadline keyword, found in a single scan
+_DEADLINE_RE = re.compile(
+    r'(?:(deadline|due|submit by)[:\s]+)?(\d{1,2}[-/]\d{1,2}[-/]\d{2,4})',
+    re.IGNORECASE
+)
+# Keyword priority when a text has several candidate dates
+_DEADLINE_KEYWORDS = ('deadline', 'due', 'submit by')
+
+# CSS classes marking RFP listing blocks
+_RFP_BLOCK_CLASS_RE = re.compile(r'rfp|tender|procurement', re.I)
+_RFP_BLOCK_TAGS = ['div', 'tr', 'article']
+
+# Characters of document text sent to the LLM (keeps prompts within token limits)
+DOCUMENT_TEXT_LIMIT = 4000
+
+# Number of loaded RFP files kept in memory
+PARSED_RFP_CACHE_SIZE = 128
+
+# File path -> ((mtime_ns, size), RFP); an entry is reused while the file is unchanged
+_parsed_rfp_cache: "OrderedDict[str, Tuple[Tuple[int, int], RFP]]" = OrderedDict()
+_parsed_rfp_cache_lock = threading.Lock()
+
 
 class RFPParserService:
     """Service for parsing RFP documents."""
@@ -37,12 +61,14 @@ class RFPParserService:
         Returns:
             List of RFP metadata dictionaries
         """
-        soup = BeautifulSoup(html_content, 'html.parser')
+        # Only RFP blocks (and their contents) are built into the tree
+        strainer = SoupStrainer(_RFP_BLOCK_TAGS, class_=_RFP_BLOCK_CLASS_RE)
+        soup = BeautifulSoup(html_content, 'lxml', parse_only=strainer)
         rfps = []
         
         # This is a simplified parser - in production, you'd customize for specific sites
         # Look for common RFP indicators
-        rfp_blocks = soup.find_all(['div', 'tr', 'article'], class_=re.compile(r'rfp|tender|procurement', re.I))
+        rfp_blocks = soup.find_all(_RFP_BLOCK_TAGS, class_=_RFP_BLOCK_CLASS_RE)
         
         for block in rfp_blocks:
             try:
@@ -73,10 +99,17 @@ class RFPParserService:
         
         # Extract title
         title_elem = block.find(['h1', 'h2', 'h3', 'h4', 'a'])
-        title = title_elem.get_text(strip=True) if title_elem else text[:100]
+        if title_elem is None:
+            title = text[:100]
+        elif type(title_elem.string) is NavigableString:
+            # Single text child (the common case): no subtree walk needed
+            title = title_elem.string.strip()
+        else:
+            title = title_elem.get_text(strip=True)
         
-        # Generate ID
-        rfp_id = f"RFP-{hash(title + source_url) % 100000:05d}"
+        # Generate ID (stable across processes, unlike the salted built-in hash)
+        digest = hashlib.blake2b((title + source_url).encode("utf-8"), digest_size=8).digest()
+        rfp_id = f"RFP-{int.from_bytes(digest, 'big') % 100000:05d}"
         
         return {
             "rfp_id": rfp_id,
@@ -95,22 +128,25 @@ class RFPParserService:
         Returns:
             Deadline datetime or None
         """
-        # Common date patterns
-        date_patterns = [
-            r'deadline[:\s]+(\d{1,2}[-/]\d{1,2}[-/]\d{2,4})',
-            r'due[:\s]+(\d{1,2}[-/]\d{1,2}[-/]\d{2,4})',
-            r'submit by[:\s]+(\d{1,2}[-/]\d{1,2}[-/]\d{2,4})',
-            r'(\d{1,2}[-/]\d{1,2}[-/]\d{2,4})',
-        ]
-        
-        for pattern in date_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                try:
-                    date_str = match.group(1)
-                    return date_parser.parse(date_str, fuzzy=True)
-                except:
-                    continue
+        # First date after each keyword, then the first date of any kind
+        first_by_keyword: Dict[str, str] = {}
+        first_date = None
+        for match in _DEADLINE_RE.finditer(text):
+            keyword, date_str = match.groups()
+            if first_date is None:
+                first_date = date_str
+            if keyword:
+                first_by_keyword.setdefault(keyword.lower(), date_str)
+        
+        candidates = [first_by_keyword.get(keyword) for keyword in _DEADLINE_KEYWORDS]
+        candidates.append(first_date)
+        for date_str in candidates:
+            if date_str is None:
+                continue
+            try:
+                return date_parser.parse(date_str, fuzzy=True)
+            except:
+                continue
         
         return None
     
@@ -138,9 +174,10 @@ Extract:
 
 Return JSON matching the RFP schema."""
         
+        document_text = content[:DOCUMENT_TEXT_LIMIT]
         user_prompt = f"""Parse this RFP document:
 
-{content[:4000]}  # Limit to avoid token limits
+{document_text}
 
 RFP ID: {rfp_id}
 Source URL: {source_url}
@@ -165,6 +202,10 @@ Return structured JSON."""
     def load_parsed_rfp(self, rfp_id: str) -> Optional[RFP]:
         """Load previously parsed RFP from disk.
         
+        Loaded RFPs are cached per file and reused until the file's
+        modification time or size changes, so callers share the returned
+        object and should not modify it.
+        
         Args:
             rfp_id: RFP identifier
             
@@ -173,17 +214,34 @@ Return structured JSON."""
         """
         parsed_dir = settings.get_rfp_parsed_dir()
         rfp_file = parsed_dir / f"{rfp_id}.json"
+        cache_key = str(rfp_file)
         
-        if not rfp_file.exists():
+        try:
+            stat = rfp_file.stat()
+        except FileNotFoundError:
+            with _parsed_rfp_cache_lock:
+                _parsed_rfp_cache.pop(cache_key, None)
             return None
+        version = (stat.st_mtime_ns, stat.st_size)
+        
+        with _parsed_rfp_cache_lock:
+            cached = _parsed_rfp_cache.get(cache_key)
+            if cached is not None and cached[0] == version:
+                _parsed_rfp_cache.move_to_end(cache_key)
+                return cached[1]
         
         try:
-            with open(rfp_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            return RFP(**data)
+            rfp = RFP.model_validate_json(rfp_file.read_bytes())
         except Exception as e:
             logger.error(f"Error loading RFP {rfp_id}: {e}")
             return None
+        
+        with _parsed_rfp_cache_lock:
+            _parsed_rfp_cache[cache_key] = (version, rfp)
+            _parsed_rfp_cache.move_to_end(cache_key)
+            while len(_parsed_rfp_cache) > PARSED_RFP_CACHE_SIZE:
+                _parsed_rfp_cache.popitem(last=False)
+        return rfp
     
     def save_parsed_rfp(self, rfp: RFP) -> bool:
         """Save parsed RFP to disk.
@@ -200,8 +258,7 @@ Return structured JSON."""
         rfp_file = parsed_dir / f"{rfp.rfp_id}.json"
         
         try:
-            with open(rfp_file, 'w', encoding='utf-8') as f:
-                json.dump(rfp.model_dump(mode='json'), f, indent=2, default=str)
+            rfp_file.write_text(rfp.model_dump_json(indent=2), encoding='utf-8')
             logger.info(f"Saved RFP {rfp.rfp_id} to {rfp_file}")
             return True
         except Exception as e:
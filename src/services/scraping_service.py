@@ -1,7 +1,14 @@
 """Web scraping service for fetching RFP pages."""
 
+import gzip
+import hashlib
+import json
 import logging
-from typing import Optional, Dict
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Optional, Dict
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
@@ -10,6 +17,73 @@ from ..config import settings
 
 logger = logging.getLogger(__name__)
 
+# Hosts with pooled connections, and pooled connections per host, in shared sessions
+SESSION_POOL_CONNECTIONS = 32
+SESSION_POOL_MAXSIZE = 64
+
+# Responses retried with backoff, and the idempotent methods that may be retried
+RETRY_STATUS_FORCELIST = frozenset((429, 500, 502, 503, 504))
+RETRY_ALLOWED_METHODS = frozenset(("HEAD", "GET", "OPTIONS"))
+
+# Shared sessions keyed by retry count, so all ScrapingService instances reuse
+# the same keep-alive connections
+_sessions: Dict[int, requests.Session] = {}
+_sessions_lock = threading.Lock()
+
+
+def _create_session(max_retries: int) -> requests.Session:
+    """Create requests session with retry logic.
+    
+    Args:
+        max_retries: Maximum retries
+        
+    Returns:
+        Configured session
+    """
+    session = requests.Session()
+    
+    # Configure retry strategy
+    retry_strategy = Retry(
+        total=max_retries,
+        backoff_factor=1,
+        status_forcelist=RETRY_STATUS_FORCELIST,
+        allowed_methods=RETRY_ALLOWED_METHODS
+    )
+    
+    # Pools sized for many hosts and for concurrent fetch_multiple workers
+    adapter = HTTPAdapter(
+        max_retries=retry_strategy,
+        pool_connections=SESSION_POOL_CONNECTIONS,
+        pool_maxsize=max(settings.scrape_concurrency, SESSION_POOL_MAXSIZE)
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    
+    # Add proxy if configured
+    if settings.proxy_url:
+        session.proxies = {
+            "http": settings.proxy_url,
+            "https": settings.proxy_url
+        }
+    
+    return session
+
+
+def _get_shared_session(max_retries: int) -> requests.Session:
+    """Get the shared session for a retry count, creating it on first use.
+    
+    Args:
+        max_retries: Maximum retries
+        
+    Returns:
+        Configured session
+    """
+    with _sessions_lock:
+        session = _sessions.get(max_retries)
+        if session is None:
+            session = _sessions[max_retries] = _create_session(max_retries)
+    return session
+
 
 class ScrapingService:
     """Service for fetching web pages."""
@@ -22,43 +96,18 @@ class ScrapingService:
             max_retries: Maximum number of retries
         """
         self.timeout = timeout
-        self.session = self._create_session(max_retries)
-    
-    def _create_session(self, max_retries: int) -> requests.Session:
-        """Create requests session with retry logic.
-        
-        Args:
-            max_retries: Maximum retries
-            
-        Returns:
-            Configured session
-        """
-        session = requests.Session()
-        
-        # Configure retry strategy
-        retry_strategy = Retry(
-            total=max_retries,
-            backoff_factor=1,
-            status_forcelist=[429, 500, 502, 503, 504],
-            allowed_methods=["HEAD", "GET", "OPTIONS"]
+        self.session = _get_shared_session(max_retries)
+        self.cache_dir: Optional[Path] = (
+            settings.get_http_cache_dir() if settings.scrape_conditional_get else None
         )
-        
-        adapter = HTTPAdapter(max_retries=retry_strategy)
-        session.mount("http://", adapter)
-        session.mount("https://", adapter)
-        
-        # Add proxy if configured
-        if settings.proxy_url:
-            session.proxies = {
-                "http": settings.proxy_url,
-                "https": settings.proxy_url
-            }
-        
-        return session
     
     def fetch_url(self, url: str) -> Optional[Dict[str, str]]:
         """Fetch content from a URL.
         
+        Pages served with an ETag or Last-Modified header are cached on disk
+        and revalidated with a conditional GET; on 304 Not Modified the cached
+        copy is returned without re-downloading the body.
+        
         Args:
             url: URL to fetch
             
@@ -72,49 +121,123 @@ class ScrapingService:
                 "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
             }
             
+            cached = self._load_cached_page(url)
+            if cached:
+                if cached.get("etag"):
+                    headers["If-None-Match"] = cached["etag"]
+                if cached.get("last_modified"):
+                    headers["If-Modified-Since"] = cached["last_modified"]
+            
             response = self.session.get(
                 url,
                 headers=headers,
                 timeout=self.timeout
             )
             
+            if cached and response.status_code == 304:
+                logger.info(f"Not modified, using cached copy of {url}")
+                return cached["page"]
+            
             response.raise_for_status()
             
-            return {
+            page = {
                 "url": url,
                 "content": response.text,
                 "status_code": response.status_code,
                 "content_type": response.headers.get("Content-Type", "")
             }
             
+            etag = response.headers.get("ETag")
+            last_modified = response.headers.get("Last-Modified")
+            if etag or last_modified:
+                self._store_cached_page(url, page, etag, last_modified)
+            
+            return page
+            
         except requests.exceptions.RequestException as e:
             logger.error(f"Error fetching {url}: {e}")
             return None
     
+    def _cache_path(self, url: str) -> Path:
+        return self.cache_dir / f"{hashlib.sha256(url.encode('utf-8')).hexdigest()}.json.gz"
+    
+    def _load_cached_page(self, url: str) -> Optional[Dict[str, Any]]:
+        """Load the cached page and validators for a URL.
+        
+        Args:
+            url: Page URL
+            
+        Returns:
+            Dict with 'page', 'etag' and 'last_modified', or None if not cached
+        """
+        if self.cache_dir is None:
+            return None
+        try:
+            with gzip.open(self._cache_path(url), "rt", encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable page cache entry for {url}: {e}")
+            return None
+    
+    def _store_cached_page(
+        self,
+        url: str,
+        page: Dict[str, Any],
+        etag: Optional[str],
+        last_modified: Optional[str]
+    ) -> None:
+        """Write a fetched page and its validators to the gzipped disk cache.
+        
+        Args:
+            url: Page URL
+            page: fetch_url result
+            etag: ETag response header
+            last_modified: Last-Modified response header
+        """
+        if self.cache_dir is None:
+            return
+        path = self._cache_path(url)
+        # Write to a per-thread temp file and rename, so concurrent fetches of
+        # the same URL never leave a partially written entry
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            with gzip.open(tmp_path, "wt", encoding="utf-8") as f:
+                json.dump({"page": page, "etag": etag, "last_modified": last_modified}, f)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            logger.warning(f"Could not cache page {url}: {e}")
+    
     def fetch_multiple(self, urls: list[str]) -> list[Dict[str, str]]:
-        """Fetch multiple URLs.
+        """Fetch multiple URLs concurrently.
         
         Args:
             urls: List of URLs to fetch
             
         Returns:
-            List of successful fetch results
+            List of successful fetch results, in input order
         """
-        results = []
-        for url in urls:
-            result = self.fetch_url(url)
-            if result:
-                results.append(result)
-        return results
+        max_workers = min(settings.scrape_concurrency, len(urls))
+        if max_workers <= 1:
+            fetched = [self.fetch_url(url) for url in urls]
+        else:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                fetched = list(executor.map(self.fetch_url, urls))
+        return [result for result in fetched if result]
 
 
 # Global service instance
 _scraping_service: Optional[ScrapingService] = None
+_scraping_service_lock = threading.Lock()
 
 
 def get_scraping_service() -> ScrapingService:
-    """Get global scraping service instance."""
+    """Get global scraping service instance (created once per process)."""
     global _scraping_service
     if _scraping_service is None:
-        _scraping_service = ScrapingService()
+        with _scraping_service_lock:
+            if _scraping_service is None:
+                _scraping_service = ScrapingService()
     return _scraping_service
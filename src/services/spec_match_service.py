@@ -1,14 +1,93 @@
 """Spec matching service for computing similarity between RFP specs and SKU features."""
 
+import functools
 import logging
 import re
-from typing import Dict, Any, Tuple , Optional
+import threading
+from collections import OrderedDict
+from typing import Dict, Any, List, Tuple , Optional, Hashable
+
+import numpy as np
+from rapidfuzz import fuzz
 
 from ..models.rfp_models import RFPItem
 from ..models.sku_models import SKU
 
 logger = logging.getLogger(__name__)
 
+# Runs of characters that are not lower-case letters or digits (name normalization)
+_NORMALIZE_RE = re.compile(r'[^a-z0-9]+')
+# First number (including decimals) in a value
+_NUMBER_RE = re.compile(r'(\d+\.?\d*)')
+
+# Minimum fuzz.token_sort_ratio (0-100) for two non-numeric values to count as a fuzzy match
+FUZZY_SCORE_CUTOFF = 50
+
+# (RFP specs, SKU) match results kept per service instance
+MATCH_CACHE_SIZE = 8192
+
+# Distinct spec/feature names and values kept in normalized form
+NAME_CACHE_SIZE = 1024
+VALUE_CACHE_SIZE = 4096
+
+
+@functools.lru_cache(maxsize=NAME_CACHE_SIZE)
+def _normalize_name(name: str) -> str:
+    """Normalize spec/feature name.
+    
+    Cached because the same spec and feature names recur across every SKU
+    and RFP item.
+    
+    Args:
+        name: Name to normalize
+        
+    Returns:
+        Normalized name
+    """
+    return _NORMALIZE_RE.sub('_', name.lower().strip()).strip('_')
+
+
+def _extract_number(text: str) -> float | None:
+    """Extract numeric value from text.
+    
+    Args:
+        text: Text containing number
+        
+    Returns:
+        Numeric value or None
+    """
+    # Match numbers (including decimals)
+    match = _NUMBER_RE.search(text)
+    if match:
+        try:
+            return float(match.group(1))
+        except ValueError:
+            return None
+    return None
+
+
+def _copy_match(result: Tuple[float, Dict[str, Any]]) -> Tuple[float, Dict[str, Any]]:
+    """Copy a match result so cache entries and callers never share dicts."""
+    match_percentage, comparison = result
+    return match_percentage, {spec: dict(details) for spec, details in comparison.items()}
+
+
+@functools.lru_cache(maxsize=VALUE_CACHE_SIZE, typed=True)
+def _normalize_value(value: Any) -> Tuple[str, float | None]:
+    """Lower-case a spec/feature value and extract its number.
+    
+    Cached because the same values recur across specs, SKUs and RFP items;
+    typed so that e.g. 1, 1.0 and True keep their own string forms.
+    
+    Args:
+        value: Spec or feature value (must be hashable)
+        
+    Returns:
+        Tuple of (normalized string, first number or None)
+    """
+    text = str(value).lower().strip()
+    return text, _extract_number(text)
+
 
 class SpecMatchService:
     """Service for computing specification match percentages."""
@@ -29,10 +108,44 @@ class SpecMatchService:
             "voltage": ["voltage_grade", "voltage", "rated voltage", "voltage rating"],
             "cores": ["number of cores", "cores", "core count", "no of cores"],
         }
+        
+        # Normalized canonical/synonym name -> normalized synonyms of its group,
+        # so resolving a spec name is one dict lookup
+        self._synonym_groups: Dict[str, Tuple[str, ...]] = {}
+        for canonical, synonyms in self.synonyms.items():
+            group = tuple(dict.fromkeys(_normalize_name(name) for name in synonyms))
+            for name in (canonical, *synonyms):
+                self._synonym_groups[_normalize_name(name)] = group
+        
+        # (tolerance, specs, SKU id and features) -> match result, LRU-ordered
+        self._match_cache: "OrderedDict[Hashable, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._match_cache_lock = threading.Lock()
     
     def compute_spec_match(self, rfp_item: RFPItem, sku: SKU) -> Tuple[float, Dict[str, Any]]:
         """Compute specification match percentage between RFP item and SKU.
         
+        Results are cached per (specs, SKU) pair; each call gets its own copy
+        of the comparison dict, so callers may modify it.
+        
+        Args:
+            rfp_item: RFP item with specifications
+            sku: SKU with features
+            
+        Returns:
+            Tuple of (match_percentage, detailed_comparison)
+        """
+        key = self._match_cache_key(self._specs_cache_key(rfp_item), sku)
+        cached = self._get_cached_match(key)
+        if cached is not None:
+            return cached
+        
+        result = self._compute_spec_match(rfp_item, sku)
+        self._cache_match(key, result)
+        return result
+    
+    def _compute_spec_match(self, rfp_item: RFPItem, sku: SKU) -> Tuple[float, Dict[str, Any]]:
+        """Compute spec match for one SKU without consulting the cache.
+        
         Args:
             rfp_item: RFP item with specifications
             sku: SKU with features
@@ -46,13 +159,19 @@ class SpecMatchService:
         total_specs = len(rfp_item.specs)
         matched_score = 0.0
         comparison = {}
+        features = self._index_features(sku)
         
         for spec_name, rfp_value in rfp_item.specs.items():
             # Find matching SKU feature
-            sku_value = self._find_matching_feature(spec_name, sku)
+            sku_value = self._find_matching_feature(_normalize_name(spec_name), features)
             
             # Compute match score for this spec
-            spec_score = self._compare_values(rfp_value, sku_value)
+            if sku_value is None:
+                spec_score = 0.0
+            else:
+                spec_score = self._compare_values(
+                    *self._normalize_value(rfp_value), *self._normalize_value(sku_value)
+                )
             matched_score += spec_score
             
             comparison[spec_name] = {
@@ -67,68 +186,211 @@ class SpecMatchService:
         
         return match_percentage, comparison
     
-    def _find_matching_feature(self, spec_name: str, sku: SKU) -> Any:
-        """Find matching feature in SKU.
+    def compute_spec_match_batch(
+        self,
+        rfp_item: RFPItem,
+        skus: List[SKU]
+    ) -> List[Tuple[float, Dict[str, Any]]]:
+        """Compute spec match for several candidate SKUs against one RFP item.
+        
+        Gives the same results as calling compute_spec_match per SKU (and shares
+        its cache), but each RFP spec value is parsed once and the numeric
+        tolerance checks run as one NumPy operation across the uncached
+        candidates.
         
         Args:
-            spec_name: RFP spec name
-            sku: SKU object
+            rfp_item: RFP item with specifications
+            skus: Candidate SKUs
             
         Returns:
-            Feature value or None
+            One (match_percentage, detailed_comparison) tuple per SKU, in input order
         """
-        normalized_spec = self._normalize_name(spec_name)
+        specs_key = self._specs_cache_key(rfp_item)
+        keys = [self._match_cache_key(specs_key, sku) for sku in skus]
+        results = [self._get_cached_match(key) for key in keys]
         
-        # Try exact match first
-        for feature in sku.features:
-            if self._normalize_name(feature.name) == normalized_spec:
-                return feature.value
+        missing = [i for i, result in enumerate(results) if result is None]
+        if missing:
+            computed = self._compute_spec_match_batch(rfp_item, [skus[i] for i in missing])
+            for i, result in zip(missing, computed):
+                results[i] = result
+                self._cache_match(keys[i], result)
         
-        # Try synonym match
-        for canonical, synonyms in self.synonyms.items():
-            if normalized_spec in synonyms or normalized_spec == canonical:
-                for feature in sku.features:
-                    if self._normalize_name(feature.name) in synonyms:
-                        return feature.value
+        return results
+    
+    def _compute_spec_match_batch(
+        self,
+        rfp_item: RFPItem,
+        skus: List[SKU]
+    ) -> List[Tuple[float, Dict[str, Any]]]:
+        """Compute spec match for several SKUs without consulting the cache.
         
-        return None
+        Args:
+            rfp_item: RFP item with specifications
+            skus: Candidate SKUs
+            
+        Returns:
+            One (match_percentage, detailed_comparison) tuple per SKU, in input order
+        """
+        if not rfp_item.specs or not skus:
+            return [(0.0, {}) for _ in skus]
+        
+        total = np.zeros(len(skus))
+        comparisons: List[Dict[str, Any]] = [{} for _ in skus]
+        sku_features = [self._index_features(sku) for sku in skus]
+        
+        for spec_name, rfp_value in rfp_item.specs.items():
+            # Spec name and value are normalized once for all candidates
+            normalized_spec = _normalize_name(spec_name)
+            sku_values = [self._find_matching_feature(normalized_spec, features) for features in sku_features]
+            scores = self._compare_values_batch(rfp_value, sku_values)
+            total += scores
+            
+            rfp_display = str(rfp_value)
+            for comparison, sku_value, score in zip(comparisons, sku_values, scores.tolist()):
+                comparison[spec_name] = {
+                    "rfp_value": rfp_display,
+                    "sku_value": str(sku_value) if sku_value is not None else "N/A",
+                    "match_score": score,
+                    "match_type": self._get_match_type(score)
+                }
+        
+        percentages = (total / len(rfp_item.specs)) * 100
+        return list(zip(percentages.tolist(), comparisons))
     
-    def _normalize_name(self, name: str) -> str:
-        """Normalize spec/feature name.
+    def _specs_cache_key(self, rfp_item: RFPItem) -> Optional[Hashable]:
+        """Build the RFP half of a match cache key.
+        
+        Each value's type is part of the key, since 1, 1.0 and True compare
+        and hash equal but normalize (and so match) differently.
         
         Args:
-            name: Name to normalize
+            rfp_item: RFP item with specifications
             
         Returns:
-            Normalized name
+            Hashable key, or None if a spec value is unhashable
         """
-        return re.sub(r'[^a-z0-9]+', '_', name.lower().strip()).strip('_')
+        key = (self.numeric_tolerance, tuple((k, type(v), v) for k, v in rfp_item.specs.items()))
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
     
-    def _compare_values(self, rfp_value: Any, sku_value: Any) -> float:
-        """Compare RFP value with SKU value.
+    def _match_cache_key(self, specs_key: Optional[Hashable], sku: SKU) -> Optional[Hashable]:
+        """Build the match cache key for one SKU.
+        
+        SKU features (with their value types) are part of the key, not just
+        the ID, so that a catalog update is never answered from a stale entry.
         
         Args:
-            rfp_value: RFP specification value
-            sku_value: SKU feature value
+            specs_key: Key from _specs_cache_key
+            sku: SKU with features
             
         Returns:
-            Match score (0.0 to 1.0)
+            Hashable key, or None if the result should not be cached
         """
-        if sku_value is None:
-            return 0.0
+        if specs_key is None:
+            return None
+        return specs_key, sku.sku_id, tuple(
+            (feature.name, type(feature.value), feature.value) for feature in sku.features
+        )
+    
+    def _get_cached_match(self, key: Optional[Hashable]) -> Optional[Tuple[float, Dict[str, Any]]]:
+        """Get a cached match result.
+        
+        Args:
+            key: Cache key (None means uncacheable)
+            
+        Returns:
+            Copy of the cached (match_percentage, detailed_comparison) or None
+        """
+        if key is None:
+            return None
+        with self._match_cache_lock:
+            cached = self._match_cache.get(key)
+            if cached is None:
+                return None
+            self._match_cache.move_to_end(key)
+        return _copy_match(cached)
+    
+    def _cache_match(self, key: Optional[Hashable], result: Tuple[float, Dict[str, Any]]) -> None:
+        """Store a copy of a match result, evicting the least recently used entries.
         
-        # Convert to strings for comparison
-        rfp_str = str(rfp_value).lower().strip()
-        sku_str = str(sku_value).lower().strip()
+        Args:
+            key: Cache key (None means uncacheable)
+            result: (match_percentage, detailed_comparison)
+        """
+        if key is None:
+            return
+        with self._match_cache_lock:
+            self._match_cache[key] = _copy_match(result)
+            self._match_cache.move_to_end(key)
+            while len(self._match_cache) > MATCH_CACHE_SIZE:
+                self._match_cache.popitem(last=False)
+    
+    def _index_features(self, sku: SKU) -> Dict[str, Tuple[int, Any]]:
+        """Normalize each SKU feature name once.
         
+        Args:
+            sku: SKU object
+            
+        Returns:
+            Dict of normalized feature name to (position, value); the first
+            feature wins when names normalize to the same key
+        """
+        features: Dict[str, Tuple[int, Any]] = {}
+        for position, feature in enumerate(sku.features):
+            features.setdefault(_normalize_name(feature.name), (position, feature.value))
+        return features
+    
+    def _find_matching_feature(self, normalized_spec: str, features: Dict[str, Tuple[int, Any]]) -> Any:
+        """Find matching feature in SKU.
+        
+        Args:
+            normalized_spec: RFP spec name, already passed through _normalize_name
+            features: SKU features indexed by _index_features
+            
+        Returns:
+            Feature value or None
+        """
+        # Try exact match first
+        exact = features.get(normalized_spec)
+        if exact is not None:
+            return exact[1]
+        
+        # Try synonym match: the earliest SKU feature named by any synonym
+        synonyms = self._synonym_groups.get(normalized_spec)
+        if synonyms:
+            matches = [features[synonym] for synonym in synonyms if synonym in features]
+            if matches:
+                return min(matches, key=lambda match: match[0])[1]
+        
+        return None
+    
+    def _compare_values(
+        self,
+        rfp_str: str,
+        rfp_num: float | None,
+        sku_str: str,
+        sku_num: float | None
+    ) -> float:
+        """Compare a normalized RFP value with a normalized SKU value.
+        
+        Args:
+            rfp_str: Lower-cased RFP specification value
+            rfp_num: Number in the RFP value, or None
+            sku_str: Lower-cased SKU feature value
+            sku_num: Number in the SKU value, or None
+            
+        Returns:
+            Match score (0.0 to 1.0)
+        """
         # Exact match
         if rfp_str == sku_str:
             return 1.0
         
         # Try numeric comparison
-        rfp_num = self._extract_number(rfp_str)
-        sku_num = self._extract_number(sku_str)
-        
         if rfp_num is not None and sku_num is not None:
             # Check if within tolerance
             tolerance = abs(rfp_num * self.numeric_tolerance)
@@ -139,38 +401,84 @@ class SpecMatchService:
             else:
                 return 0.0  # No match
         
+        return self._compare_text(rfp_str, sku_str)
+    
+    def _compare_values_batch(self, rfp_value: Any, sku_values: List[Any]) -> np.ndarray:
+        """Compare one RFP value against many SKU values.
+        
+        Args:
+            rfp_value: RFP specification value
+            sku_values: SKU feature values (None where the SKU lacks the feature)
+            
+        Returns:
+            Array of match scores (0.0 to 1.0), one per SKU value
+        """
+        scores = np.zeros(len(sku_values))
+        rfp_str, rfp_num = self._normalize_value(rfp_value)
+        
+        # SKU numbers for the vectorized tolerance check; NaN marks "not numeric"
+        sku_nums = np.full(len(sku_values), np.nan)
+        text_only = []
+        
+        for i, sku_value in enumerate(sku_values):
+            if sku_value is None:
+                continue
+            sku_str, sku_num = self._normalize_value(sku_value)
+            if rfp_str == sku_str:
+                scores[i] = 1.0
+                continue
+            if rfp_num is not None and sku_num is not None:
+                sku_nums[i] = sku_num
+            else:
+                text_only.append((i, sku_str))
+        
+        if rfp_num is not None:
+            numeric = ~np.isnan(sku_nums)
+            diff = np.abs(rfp_num - sku_nums[numeric])
+            tolerance = abs(rfp_num * self.numeric_tolerance)
+            scores[numeric] = np.where(
+                diff <= tolerance, 0.8, np.where(diff <= tolerance * 2, 0.5, 0.0)
+            )
+        
+        for i, sku_str in text_only:
+            scores[i] = self._compare_text(rfp_str, sku_str)
+        
+        return scores
+    
+    def _compare_text(self, rfp_str: str, sku_str: str) -> float:
+        """Compare normalized non-numeric values by substring and edit similarity.
+        
+        Args:
+            rfp_str: Lower-cased RFP value
+            sku_str: Lower-cased SKU value
+            
+        Returns:
+            Match score (0.0 to 0.6)
+        """
         # Substring match
         if rfp_str in sku_str or sku_str in rfp_str:
             return 0.6
         
-        # Check for common words
-        rfp_words = set(rfp_str.split())
-        sku_words = set(sku_str.split())
-        common_words = rfp_words & sku_words
-        
-        if common_words:
-            overlap = len(common_words) / max(len(rfp_words), len(sku_words))
-            return overlap * 0.5
-        
-        return 0.0
+        # Levenshtein-based similarity over sorted words: word order is ignored
+        # as before, near-misses such as "coper" vs "copper" now score, and the
+        # computation stops early once the cutoff can no longer be reached
+        similarity = fuzz.token_sort_ratio(rfp_str, sku_str, score_cutoff=FUZZY_SCORE_CUTOFF)
+        return similarity / 100.0 * 0.6
     
-    def _extract_number(self, text: str) -> float | None:
-        """Extract numeric value from text.
+    def _normalize_value(self, value: Any) -> Tuple[str, float | None]:
+        """Get the normalized (string, number) form of a value.
         
         Args:
-            text: Text containing number
+            value: Spec or feature value
             
         Returns:
-            Numeric value or None
-        """
-        # Match numbers (including decimals)
-        match = re.search(r'(\d+\.?\d*)', text)
-        if match:
-            try:
-                return float(match.group(1))
-            except ValueError:
-                return None
-        return None
+            Tuple of (lower-cased string, first number or None)
+        """
+        try:
+            return _normalize_value(value)
+        except TypeError:
+            # Unhashable values (lists, dicts from LLM-extracted specs) bypass the cache
+            return _normalize_value.__wrapped__(value)
     
     def _get_match_type(self, score: float) -> str:
         """Get match type description from score.
@@ -195,11 +503,14 @@ class SpecMatchService:
 
 # Global service instance
 _spec_match_service: Optional[SpecMatchService] = None
+_spec_match_service_lock = threading.Lock()
 
 
 def get_spec_match_service() -> SpecMatchService:
-    """Get global spec match service instance."""
+    """Get global spec match service instance (created once per process)."""
     global _spec_match_service
     if _spec_match_service is None:
-        _spec_match_service = SpecMatchService()
+        with _spec_match_service_lock:
+            if _spec_match_service is None:
+                _spec_match_service = SpecMatchService()
     return _spec_match_service
@@ -11,6 +11,8 @@ import logging
 from datetime import datetime
 import pandas as pd
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from src.config import settings
 
 # Configure logging
@@ -28,6 +30,13 @@ API_HOST = os.getenv("API_HOST", "localhost")
 API_BASE_URL = f"http://{API_HOST}:8000/api/v1"
 WORKFLOW_API = f"{API_BASE_URL}/workflow"
 
+# Seconds a sidebar service status check is reused before it is re-issued
+SERVICE_STATUS_TTL_SECONDS = 30
+
+# Keep-alive connections to the API shared by all Streamlit sessions
+API_POOL_CONNECTIONS = 50
+API_POOL_MAXSIZE = 50
+
 
 # Page configuration
 st.set_page_config(
@@ -153,6 +162,48 @@ def init_session_state():
         st.session_state.workflow_running = False
 
 
+@st.cache_resource
+def get_http() -> requests.Session:
+    """Get the pooled HTTP session for API calls, shared across reruns.
+    
+    Connection failures are retried with a short backoff; HTTP error
+    responses are returned as-is so callers see the API's error detail.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=API_POOL_CONNECTIONS,
+        pool_maxsize=API_POOL_MAXSIZE,
+        max_retries=Retry(total=3, backoff_factor=0.2)
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+@st.cache_resource
+def get_qdrant_client():
+    """Get the Qdrant client, built once per process and shared across reruns."""
+    from qdrant_client import QdrantClient
+    return QdrantClient(
+        url=settings.qdrant_url,
+        api_key=settings.qdrant_api_key,
+        prefer_grpc=False
+    )
+
+
+@st.cache_resource
+def get_cohere_client():
+    """Get the Cohere client, built once per process and shared across reruns."""
+    import cohere
+    return cohere.ClientV2(api_key=settings.cohere_api_key)
+
+
+@st.cache_data(ttl=SERVICE_STATUS_TTL_SECONDS, show_spinner=False)
+def get_qdrant_collection_count() -> int:
+    """Get the number of Qdrant collections (failures are not cached)."""
+    return len(get_qdrant_client().get_collections().collections)
+
+
 def sidebar():
     """Render sidebar."""
     with st.sidebar:
@@ -163,21 +214,14 @@ def sidebar():
         
         # Check Qdrant connection
         try:
-            from qdrant_client import QdrantClient
-            qdrant_client = QdrantClient(
-                url=settings.qdrant_url,
-                api_key=settings.qdrant_api_key,
-                prefer_grpc=False
-            )
-            collections = qdrant_client.get_collections()
-            st.success(f"✅ Qdrant connected ({len(collections.collections)} collections)")
+            collection_count = get_qdrant_collection_count()
+            st.success(f"✅ Qdrant connected ({collection_count} collections)")
         except Exception as e:
             st.error(f"❌ Qdrant: {str(e)[:50]}")
         
         # Check Cohere API
         try:
-            import cohere
-            cohere_client = cohere.ClientV2(api_key=settings.cohere_api_key)
+            get_cohere_client()
             st.success("✅ Cohere API ready")
         except Exception as e:
             st.error(f"❌ Cohere: {str(e)[:50]}")
@@ -196,6 +240,38 @@ def sidebar():
         # """)
 
 
+@st.cache_data(show_spinner=False)
+def _rfps_to_table(rfps: list[dict]) -> pd.DataFrame:
+    """Build the RFP discovery table.
+    
+    Streamlit reruns the script on every widget interaction; caching on the
+    RFP list's content skips the date parsing and summary truncation until
+    a new scan changes the list. Columns are Arrow-backed, so st.dataframe
+    needs no object -> Arrow conversion.
+    
+    Args:
+        rfps: RFP overviews returned by the scan endpoint
+        
+    Returns:
+        DataFrame for display
+    """
+    return pd.DataFrame({
+        "RFP ID": pd.array([rfp['rfp_id'] for rfp in rfps], dtype="string[pyarrow]"),
+        "Title": pd.array([rfp['title'] for rfp in rfps], dtype="string[pyarrow]"),
+        "Deadline": pd.array(
+            [datetime.fromisoformat(rfp['submission_deadline']).date() for rfp in rfps],
+            dtype="date32[pyarrow]"
+        ),
+        "Summary": pd.array(
+            [
+                rfp['brief_summary'][:100] + "..." if len(rfp['brief_summary']) > 100 else rfp['brief_summary']
+                for rfp in rfps
+            ],
+            dtype="string[pyarrow]"
+        )
+    })
+
+
 def rfp_discovery_section():
     """Render RFP discovery section."""
     st.header("📋 RFP Discovery")
@@ -209,7 +285,7 @@ def rfp_discovery_section():
         if st.button("🔍 Scan RFPs", use_container_width=True, type="primary"):
             with st.spinner("Scanning for RFPs..."):
                 try:
-                    response = requests.get(f"{WORKFLOW_API}/scan-rfps")
+                    response = get_http().get(f"{WORKFLOW_API}/scan-rfps")
                     response.raise_for_status()
                     rfps = response.json()
                     st.session_state.rfps = rfps
@@ -225,27 +301,21 @@ def rfp_discovery_section():
         st.markdown("---")
         st.subheader("Available RFPs")
         
-        # Create DataFrame for display
-        rfp_data = []
-        for rfp in st.session_state.rfps:
-            rfp_data.append({
-                "RFP ID": rfp['rfp_id'],
-                "Title": rfp['title'],
-                "Deadline": datetime.fromisoformat(rfp['submission_deadline']).strftime("%Y-%m-%d"),
-                "Summary": rfp['brief_summary'][:100] + "..." if len(rfp['brief_summary']) > 100 else rfp['brief_summary']
-            })
-        
-        df = pd.DataFrame(rfp_data)
+        # Create DataFrame for display (rebuilt only when the RFP list changes)
+        df = _rfps_to_table(st.session_state.rfps)
         
         # Display table
         st.dataframe(df, use_container_width=True, hide_index=True)
         
         # Selection
         st.markdown("---")
+        title_by_id = {}
+        for rfp in st.session_state.rfps:
+            title_by_id.setdefault(rfp['rfp_id'], rfp['title'])
         selected_id = st.selectbox(
             "Select RFP to process:",
             options=[rfp['rfp_id'] for rfp in st.session_state.rfps],
-            format_func=lambda x: f"{x} - {next(r['title'] for r in st.session_state.rfps if r['rfp_id'] == x)}"
+            format_func=lambda x: f"{x} - {title_by_id[x]}"
         )
         
         if selected_id:
@@ -294,7 +364,7 @@ def agent_workflow_section():
                 
                 # Run workflow via API
                 api_url = f"{WORKFLOW_API}/process-rfp/{st.session_state.selected_rfp_id}"
-                response = requests.post(api_url)
+                response = get_http().post(api_url)
                 response.raise_for_status()
                 final_response = response.json()
                 st.session_state.final_response = final_response
@@ -317,8 +387,13 @@ def agent_workflow_section():
                 st.session_state.workflow_running = False
 
 
+@st.fragment
 def results_section():
-    """Render results section."""
+    """Render results section.
+    
+    Runs as a fragment: interacting with its own widgets reruns only this
+    section, not the whole page.
+    """
     if not st.session_state.final_response:
         return
     
@@ -341,7 +416,7 @@ def results_section():
         st.subheader("Technical Recommendations")
         
         # Product table
-        product_df = pd.DataFrame(response['final_product_table'])
+        product_df = pd.DataFrame(response['final_product_table']).convert_dtypes(dtype_backend="pyarrow")
         if not product_df.empty:
             st.dataframe(product_df, use_container_width=True, hide_index=True)
             
@@ -362,13 +437,15 @@ def results_section():
         st.subheader("Pricing Breakdown")
         
         # Pricing table
-        pricing_df = pd.DataFrame(response['pricing_table'])
+        pricing_df = pd.DataFrame(response['pricing_table']).convert_dtypes(dtype_backend="pyarrow")
         if not pricing_df.empty:
             # Format currency columns
             currency_cols = ['unit_price', 'material_cost', 'test_cost', 'total_cost']
             for col in currency_cols:
                 if col in pricing_df.columns:
-                    pricing_df[col] = pricing_df[col].apply(lambda x: f"₹{x:,.2f}")
+                    pricing_df[col] = pd.array(
+                        [f"₹{x:,.2f}" for x in pricing_df[col]], dtype="string[pyarrow]"
+                    )
             
             st.dataframe(pricing_df, use_container_width=True, hide_index=True)
             
@@ -419,7 +496,7 @@ def sku_database_section():
     # Fetch SKUs from API
     if refresh or 'skus_loaded' not in st.session_state:
         try:
-            response = requests.get(f"{API_BASE_URL}/skus?limit=100")
+            response = get_http().get(f"{API_BASE_URL}/skus?limit=100")
             response.raise_for_status()
             data = response.json()
             st.session_state.sku_list = data.get("items", [])